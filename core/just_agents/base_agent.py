@@ -1,6 +1,6 @@
 import copy
 from pydantic import Field, PrivateAttr, computed_field
-from typing import Optional, List, Union, Any, Generator, Dict, ClassVar, Protocol
+from typing import Optional, List, Union, Any, Generator, Dict, ClassVar, Protocol, Callable
 from functools import partial
 
 from just_agents.data_classes import FinishReason, ToolCall, Message, Role
@@ -382,8 +382,13 @@ class BaseAgent(
         if not memory:
             memory = self.memory
         messages: SupportedMessages = []
+        tools = self.tools  # resolve the tools mapping once for the whole batch of calls
+
+        def call_by_name(function_name: str) -> Callable:
+            return tools[function_name].get_callable()
+
         for call in function_calls:
-            msg = call.execute_function(lambda function_name: self.tools[function_name].get_callable())
+            msg = call.execute_function(call_by_name)
             self.handle_on_response(msg, action='response', source='tool')
             self.add_to_memory(msg, memory)
             messages.append(msg)
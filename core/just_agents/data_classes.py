@@ -1,7 +1,9 @@
 from enum import Enum
+from copy import deepcopy
 from typing import List, Union, Optional
 from pydantic import HttpUrl, Field, BaseModel, ConfigDict, AliasPath, field_validator, field_serializer
 from pydantic_core import from_json
+import orjson
 
 """ Common OpenAI-compatible data structures """
 
@@ -89,9 +91,14 @@ class Message(BaseModel):
             str: The concatenated text or the content string.
         """
         content = self.content
+        if type(content) is str:
+            return content
         if isinstance(content, list):
-            # Filter for TextContent items
-            text_items = [item.text for item in content if isinstance(item, TextContent)]
+            # Filter for TextContent items, exact type check first to skip the isinstance MRO walk
+            text_items = tuple(
+                item.text for item in content
+                if type(item) is TextContent or isinstance(item, TextContent)
+            )
             # Join with the delimiter and optionally add a trailing one
             joined_text = delimiter.join(text_items)
             return joined_text + delimiter if preserve_trailing and text_items else joined_text
@@ -100,9 +107,13 @@ class Message(BaseModel):
         return ""
 
     def text_format(self, delimiter: str = " ", preserve_trailing: bool = False) -> 'Message':
-        message = self.model_copy(deep=True)
-        message.content = self.get_text(delimiter, preserve_trailing)
-        return message
+        # Rebuild without validation instead of deep-copying content items that are about to be replaced
+        fields = {name: getattr(self, name) for name in type(self).model_fields if name != "content"}
+        return type(self).model_construct(
+            _fields_set=self.model_fields_set | {"content"},
+            content=self.get_text(delimiter, preserve_trailing),
+            **deepcopy(fields)
+        )
 
 
 class ToolCall(BaseModel):
@@ -129,6 +140,17 @@ class ToolCall(BaseModel):
     @field_validator('arguments', mode='before')
     @classmethod
     def parse_arguments(cls, value):
+        if isinstance(value, (dict, list)):
+            return value  # already parsed
+        if isinstance(value, (str, bytes, bytearray)):
+            # Complete JSON documents (the common case) go through orjson,
+            # only truncated or malformed ones need the slower partial parser.
+            stripped = value.strip()
+            if stripped[:1] in ('{', '[', b'{', b'[') and stripped[-1:] in ('}', ']', b'}', b']'):
+                try:
+                    return orjson.loads(stripped)
+                except orjson.JSONDecodeError:
+                    pass
         try:
             parsed = from_json(value, allow_partial=True)
             return parsed
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 import uuid
 import time
-import json
+import orjson
 
 from pydantic import BaseModel
 from typing import Callable, Union, AsyncGenerator, List, Sequence, ClassVar, Type, TypeVar, Generic, Any, Optional, Dict, Generator
@@ -396,7 +396,8 @@ class IProtocolAdapter(ABC, Generic[BaseModelResponse, BaseModelStreamResponse,
         include_usage: bool = True,
         usage: Optional[Dict[str, int]] = None,
         include_token_details: bool = False,
-        format_as_sse: bool = False
+        format_as_sse: bool = False,
+        created_timestamp: Optional[int] = None
     ) -> Generator[Dict[str, Any], None, None]:
         """
         Creates a generator that yields a series of chunks mimicking the OpenAI streaming protocol.
@@ -414,17 +415,20 @@ class IProtocolAdapter(ABC, Generic[BaseModelResponse, BaseModelStreamResponse,
                    'completion_tokens', and 'total_tokens'
             include_token_details: Whether to include detailed token breakdown
             format_as_sse: Whether to format the output as Server-Sent Events
+            created_timestamp: Optional creation timestamp shared by all chunks (current time if not provided)
             
         Returns:
             A generator yielding streaming chunks in OpenAI format
         """
-        # Generate a response ID to use for all chunks
+        # Generate a response ID and a creation time to use for all chunks
         chunk_id = response_id or IProtocolAdapter.get_chat_completion_id()
+        created = created_timestamp or int(time.time())
         
         # 1. First chunk: Content with role
         first_chunk = IProtocolAdapter.create_complete_response(
             content_str=content,
             response_id=chunk_id,
+            created_timestamp=created,
             model=model,
             role=role,
             is_streaming=True,
@@ -447,7 +451,8 @@ class IProtocolAdapter(ABC, Generic[BaseModelResponse, BaseModelStreamResponse,
             include_usage=False,
             include_token_details=include_token_details,
             finish_reason=finish_reason,
-            response_id=chunk_id
+            response_id=chunk_id,
+            created_timestamp=created
         )
         
         if format_as_sse:
@@ -474,6 +479,7 @@ class IProtocolAdapter(ABC, Generic[BaseModelResponse, BaseModelStreamResponse,
                 include_token_details=include_token_details,
                 finish_reason=None,
                 response_id=chunk_id,
+                created_timestamp=created,
                 usage=usage
             )
             
@@ -514,12 +520,12 @@ class IProtocolAdapter(ABC, Generic[BaseModelResponse, BaseModelStreamResponse,
                 if isinstance(json_data, dict):
                     json_dict = json_data
                 elif isinstance(json_data, str):
-                    json_dict = json.loads(json_data)
+                    json_dict = orjson.loads(json_data)
                 if "choices" in json_dict and len(json_dict["choices"]) > 0:
                     delta = json_dict["choices"][0].get("delta", {})
                     if "content" in delta:
                         response_content += delta["content"]
-            except (ValueError, KeyError, TypeError, json.JSONDecodeError) as e:
+            except (ValueError, KeyError, TypeError, orjson.JSONDecodeError) as e:
                 # Only catch specific exceptions related to parsing
                 continue
         return response_content
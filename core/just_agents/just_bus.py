@@ -1,16 +1,27 @@
-from collections import deque
-from typing import Callable, Dict, List, Any, ParamSpec, Protocol, Tuple, Deque, Optional, Set
+import sys
+import threading
+from array import array
+from bisect import insort
+from typing import Callable, Dict, List, Any, ParamSpec, Protocol, Tuple, Optional
 
 class SingletonMeta(type):
     """
     A metaclass that creates a Singleton base type when called.
     """
-    _instances: Dict[type, object] = {}
+    _instances: Dict[str, object] = {}
+    _lock = threading.RLock()  # reentrant: a singleton's __init__ may construct other singletons
 
     def __call__(cls, *args, **kwargs):
-        if cls.__qualname__ not in cls._instances:
-            cls._instances[cls.__qualname__] = super(SingletonMeta, cls).__call__(*args, **kwargs)
-        return cls._instances[cls.__qualname__]
+        instances = SingletonMeta._instances
+        key = cls.__qualname__
+        instance = instances.get(key)
+        if instance is None:
+            with SingletonMeta._lock:
+                instance = instances.get(key)  # another thread may have won the race
+                if instance is None:
+                    instance = super(SingletonMeta, cls).__call__(*args, **kwargs)
+                    instances[key] = instance
+        return instance
 
 VariArgs = ParamSpec('VariArgs')
 
@@ -19,6 +30,27 @@ class SubscriberCallback(Protocol):
     def __call__(self, event_prefix: str, *args: VariArgs.args, **kwargs: VariArgs.kwargs) -> None:
         ...
 
+SubscriberEntry = Tuple[int, SubscriberCallback]
+"""A subscribed callback tagged with its integer id in the bus callback registry."""
+
+WildcardPattern = Tuple[int, str, str, int, List[SubscriberEntry]]
+"""A cached '<prefix>.*' subscription: (depth in segments, prefix, prefix with trailing dot, its length, entries)."""
+
+_GENERATION_LIMIT = 2 ** 31  # dispatch generations fit any array('I') item width
+_WILDCARD_SCAN_LIMIT = 8  # up to this many wildcard patterns a flat scan beats splitting the event name
+
+
+class _TrieNode:
+    """
+    A node of the segmented wildcard index.
+    Event names are split by '.', each segment descends one level of the trie.
+    """
+    __slots__ = ('children', 'wild')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.wild: Optional[List[SubscriberEntry]] = None  # subscribers of the '<name>.*' pattern ending at this node
+
 
 class JustEventBus(metaclass=SingletonMeta):
     """
@@ -32,11 +64,180 @@ class JustEventBus(metaclass=SingletonMeta):
     """
     _subscribers: Dict[str, List[SubscriberCallback]]
     _signature_registry: Dict[str, List[str]]
+    _exact_subscribers: Dict[str, List[SubscriberEntry]]
+    _trie: _TrieNode
+    _wildcard_patterns: List[WildcardPattern]
+    _callback_ids: Dict[SubscriberCallback, int]
+    _callback_refcounts: List[int]
+    _free_callback_ids: List[int]
+    _dispatch_state: threading.local
 
     def __init__(self) -> None:
         """Initialize the basic event bus."""
         self._subscribers = {}
         self._signature_registry = {}
+        self._exact_subscribers = {}
+        self._trie = _TrieNode()
+        self._wildcard_patterns = []
+        self._callback_ids = {}
+        self._callback_refcounts = []
+        self._free_callback_ids = []
+        self._dispatch_state = threading.local()
+
+    def _acquire_callback_id(self, callback: SubscriberCallback) -> int:
+        """
+        Get the registry id of a callback, registering it on its first subscription.
+        Ids are small reusable integers indexing the per-thread 'seen' generation array used by dispatch.
+        """
+        callback_id = self._callback_ids.get(callback)
+        if callback_id is None:
+            if self._free_callback_ids:
+                callback_id = self._free_callback_ids.pop()
+            else:
+                callback_id = len(self._callback_refcounts)
+                self._callback_refcounts.append(0)
+            self._callback_ids[callback] = callback_id
+        self._callback_refcounts[callback_id] += 1
+        return callback_id
+
+    def _release_callback_id(self, callback: SubscriberCallback) -> None:
+        """Drop one subscription reference of a callback, freeing its id once no subscription uses it."""
+        callback_id = self._callback_ids.get(callback)
+        if callback_id is None:
+            return
+        self._callback_refcounts[callback_id] -= 1
+        if self._callback_refcounts[callback_id] <= 0:
+            del self._callback_ids[callback]
+            self._free_callback_ids.append(callback_id)
+
+    def _next_generation(self) -> Tuple[int, array]:
+        """
+        Start a new dispatch generation for the current thread.
+
+        Returns:
+            A tuple of (generation, seen) where seen[callback_id] == generation marks callbacks
+            already collected by this dispatch.
+        """
+        state = self._dispatch_state
+        seen: Optional[array] = getattr(state, 'seen', None)
+        if seen is None:
+            seen = state.seen = array('I')
+            state.generation = 0
+        missing = len(self._callback_refcounts) - len(seen)
+        if missing > 0:
+            seen.extend([0] * missing)
+        generation = state.generation + 1
+        if generation >= _GENERATION_LIMIT:
+            # wrap around: forget all stale tags
+            seen[:] = array('I', [0]) * len(seen)
+            generation = 1
+        state.generation = generation
+        return generation, seen
+
+    @staticmethod
+    def _split_pattern(event_prefix: str) -> Tuple[List[str], bool]:
+        """
+        Split a subscription key into trie segments.
+
+        Args:
+            event_prefix: The event name or pattern, e.g. 'mytool.call' or 'mytool.*'
+
+        Returns:
+            A tuple of (segments, is_wildcard). The pattern '.*' maps to the root node and matches every event.
+        """
+        if event_prefix.endswith('.*'):
+            prefix = event_prefix[:-2]
+            return (prefix.split('.') if prefix else []), True
+        return event_prefix.split('.'), False
+
+    def _index_subscription(self, event_prefix: str, entry: SubscriberEntry) -> None:
+        """Append a subscriber entry to the index of a subscription key."""
+        segments, is_wildcard = self._split_pattern(event_prefix)
+        if not is_wildcard:
+            self._exact_subscribers.setdefault(event_prefix, []).append(entry)
+            return
+        node = self._trie
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[sys.intern(segment)] = _TrieNode()
+            node = child
+        if node.wild is None:
+            node.wild = []
+            prefix = sys.intern('.'.join(segments))
+            prefix_dot = f"{prefix}." if prefix else ""
+            # keep the cache ordered by depth (stable), the same order the trie walk yields matches in
+            insort(
+                self._wildcard_patterns,
+                (len(segments), prefix, prefix_dot, len(prefix_dot), node.wild),
+                key=lambda pattern: pattern[0]
+            )
+        node.wild.append(entry)
+
+    @staticmethod
+    def _remove_entry(entries: List[SubscriberEntry], callback: SubscriberCallback) -> None:
+        """Remove the first entry of a callback from an entries list."""
+        for i, (_, cb) in enumerate(entries):
+            if cb == callback:
+                del entries[i]
+                return
+
+    def _unindex_subscription(self, event_prefix: str, callback: SubscriberCallback) -> None:
+        """Remove the first entry of a callback from the index, pruning trie nodes that became empty."""
+        segments, is_wildcard = self._split_pattern(event_prefix)
+        if not is_wildcard:
+            entries = self._exact_subscribers.get(event_prefix)
+            if entries is not None:
+                self._remove_entry(entries, callback)
+                if not entries:
+                    del self._exact_subscribers[event_prefix]
+            return
+        path: List[Tuple[_TrieNode, str]] = []
+        node = self._trie
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, segment))
+            node = child
+        entries = node.wild
+        if entries:
+            self._remove_entry(entries, callback)
+            if not entries:
+                node.wild = None
+                self._wildcard_patterns = [
+                    pattern for pattern in self._wildcard_patterns if pattern[4] is not entries
+                ]
+        # prune the branch bottom-up while nodes carry no subscribers and no children
+        for parent, segment in reversed(path):
+            child = parent.children[segment]
+            if child.children or child.wild:
+                break
+            del parent.children[segment]
+
+    def _matching_wildcards(self, event_name: str) -> List[List[SubscriberEntry]]:
+        """
+        Collect the entries of all '<prefix>.*' subscriptions matching the event name, shallowest first.
+        A handful of patterns is scanned directly, larger sets are resolved by walking the trie.
+        """
+        matches: List[List[SubscriberEntry]] = []
+        wildcards = self._wildcard_patterns
+        if len(wildcards) <= _WILDCARD_SCAN_LIMIT:
+            # a slice comparison against the precomputed length avoids a startswith method call per pattern
+            for _, prefix, prefix_dot, dot_len, entries in wildcards:
+                if event_name[:dot_len] == prefix_dot or event_name == prefix:
+                    matches.append(entries)
+            return matches
+        node = self._trie
+        if node.wild:
+            matches.append(node.wild)
+        for segment in event_name.split('.'):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.wild:
+                matches.append(node.wild)
+        return matches
 
     @staticmethod
     def extract_function_signature(callback: SubscriberCallback) -> dict[str, str]:
@@ -92,6 +293,8 @@ class JustEventBus(metaclass=SingletonMeta):
         Returns:
             True indicating successful subscription.
         """
+        # Interned keys let publishers that intern their event names (e.g. JustTool) hit the identity fast path
+        event_prefix = sys.intern(event_prefix)
         if event_prefix not in self._subscribers:
             self._subscribers[event_prefix] = []
         if event_prefix not in self._signature_registry:
@@ -100,7 +303,8 @@ class JustEventBus(metaclass=SingletonMeta):
         if signature not in self._signature_registry[event_prefix]:
             self._signature_registry[event_prefix].append(signature)
         self._subscribers[event_prefix].append(callback)
-        
+        self._index_subscription(event_prefix, (self._acquire_callback_id(callback), callback))
+
         return True
 
     def subscribe_unique_by_class(self, event_prefix: str, callback: SubscriberCallback) -> bool:
@@ -121,7 +325,7 @@ class JustEventBus(metaclass=SingletonMeta):
             True if subscription was added, False if it already exists.
         """
         signature = self.extract_function_signature(callback)
-        if signature not in self._signature_registry[event_prefix]:
+        if signature not in self._signature_registry.get(event_prefix, []):
             self.subscribe(event_prefix, callback)
             return True
         return False
@@ -141,19 +345,33 @@ class JustEventBus(metaclass=SingletonMeta):
         if event_prefix in self._subscribers:
             try:
                 self._subscribers[event_prefix].remove(callback)
-                self._signature_registry[event_prefix] = self._get_signatures_for_prefix(event_prefix) #rebuild the registry node
-                return True
             except ValueError:
                 # Callback not found in the list
                 return False
+            self._unindex_subscription(event_prefix, callback)
+            self._release_callback_id(callback)
+            if self._subscribers[event_prefix]:
+                self._signature_registry[event_prefix] = self._get_signatures_for_prefix(event_prefix) #rebuild the registry node
+            else:
+                # drop the empty subscription to keep the index compact
+                del self._subscribers[event_prefix]
+                self._signature_registry.pop(event_prefix, None)
+            return True
         return False
 
+    def _has_subscribers(self, event_name: str) -> bool:
+        """Check whether any subscription matches the event name, without invoking callbacks."""
+        if event_name in self._exact_subscribers:
+            return True
+        return bool(self._wildcard_patterns) and bool(self._matching_wildcards(event_name))
+
     def publish(self, event_name: str, *args: Any, **kwargs: Any) -> bool:
         """Publish an event to all matching subscribers.
 
         The event is delivered to:
           1. Subscribers that exactly match the event name.
-          2. Subscribers with prefix patterns (ending in '.*') where the event name starts with the prefix.
+          2. Subscribers with prefix patterns (ending in '.*') whose prefix matches the leading
+             dot-separated segments of the event name ('mytool.*' matches 'mytool' and 'mytool.call').
 
         Args:
             event_name: The name of the event to publish.
@@ -176,24 +394,39 @@ class JustEventBus(metaclass=SingletonMeta):
         Returns:
             True if at least one subscriber received the event.
         """
-        # Get exact-match subscribers.
-        exact_callbacks = self._subscribers.get(event_name, [])
-
-        # Find prefix-matching subscribers.
-        prefix_callbacks: List[SubscriberCallback] = []
-        for pattern, callbacks in self._subscribers.items():
-            if pattern.endswith('.*'):
-                prefix = pattern[:-2]
-                if event_name.startswith(prefix):
-                    prefix_callbacks.extend(callbacks)
-
-        # Invoke callbacks with deduplication (preserving subscription order).
-        seen: Set[SubscriberCallback] = set()
-        for cb in exact_callbacks + prefix_callbacks:
-            if cb not in seen:
-                cb(event_name, *args, **kwargs)
-                seen.add(cb)
-        return len(seen) > 0
+        # Exact-match subscribers resolve with a single lookup, wildcard matching is skipped when no patterns exist.
+        exact = self._exact_subscribers.get(event_name)
+        path: List[List[SubscriberEntry]] = [exact] if exact else []
+        if self._wildcard_patterns:
+            path.extend(self._matching_wildcards(event_name))
+        if not path:
+            return False
+
+        # Deduplicate by tagging callback ids with the current generation (preserving subscription order).
+        # Callbacks are collected before invoking any of them, so re-entrant publishing cannot disturb the tags.
+        generation, seen = self._next_generation()
+        callbacks: List[SubscriberCallback] = []
+        for entries in path:
+            for callback_id, cb in entries:
+                if callback_id >= len(seen):
+                    # subscribed from another thread after seen was sized, seen is thread-local so grow it here
+                    seen.extend([0] * (callback_id + 1 - len(seen)))
+                if seen[callback_id] != generation:
+                    seen[callback_id] = generation
+                    callbacks.append(cb)
+        for cb in callbacks:
+            cb(event_name, *args, **kwargs)
+        return True
+
+class _BufferedEvent:
+    """A reusable record of an undelivered event, recycled through the BufferedEventBus pool."""
+    __slots__ = ('name', 'args', 'kwargs')
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+        self.args: Tuple[Any, ...] = ()
+        self.kwargs: Dict[str, Any] = {}
+
 
 class BufferedEventBus(JustEventBus):
     """
@@ -203,8 +436,13 @@ class BufferedEventBus(JustEventBus):
     number of items). Buffer flush is attempted at each publish or subscribe event,
     preserving the order of events.
     """
-    _buffer: Deque[Tuple[str, Tuple[Any, ...], Dict[str, Any]]]  # (event_name, args, kwargs)
+    _buffer: List[_BufferedEvent]
     _buffer_max_size: int
+    _pool: List[_BufferedEvent]
+    _flushing: bool
+    _flush_requested: bool
+    _deferred_trims: List[str]
+    _pumping: bool
 
     def __init__(self, buffer_size: int = 255) -> None:
         """
@@ -216,7 +454,39 @@ class BufferedEventBus(JustEventBus):
         """
         super().__init__()
         self._buffer_max_size = buffer_size
-        self._buffer = deque(maxlen=self._buffer_max_size)
+        self._buffer = []
+        self._pool = [_BufferedEvent() for _ in range(self._buffer_max_size)]
+        self._flushing = False
+        self._flush_requested = False
+        self._deferred_trims = []
+        self._pumping = False
+
+    def _buffer_event(self, event_name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """Store an undelivered event in a pooled record, dropping the oldest ones if the buffer is full."""
+        if self._buffer_max_size <= 0:
+            return
+        if not self._flushing:  # while flushing, the buffer is trimmed once the pass is over
+            self._drop_overflow(self._buffer_max_size - 1)  # make room first so the freed record is reused
+        record = self._pool.pop() if self._pool else _BufferedEvent()
+        record.name = event_name
+        record.args = args
+        record.kwargs = kwargs
+        self._buffer.append(record)
+
+    def _drop_overflow(self, limit: Optional[int] = None) -> None:
+        """Drop the oldest buffered events beyond the limit (the maximum buffer size by default)."""
+        excess = len(self._buffer) - (self._buffer_max_size if limit is None else limit)
+        if excess > 0:
+            for record in self._buffer[:excess]:
+                self._release_event(record)
+            del self._buffer[:excess]
+
+    def _release_event(self, record: _BufferedEvent) -> None:
+        """Clear a record so it does not keep payloads alive and return it to the pool."""
+        record.name = None
+        record.args = ()
+        record.kwargs = {}
+        self._pool.append(record)
 
     def subscribe_unique_by_class(self, event_prefix: str, callback: SubscriberCallback) -> bool:
         """Subscribe a callback with class-level uniqueness enforcement.
@@ -256,55 +526,119 @@ class BufferedEventBus(JustEventBus):
 
         The event is delivered to:
           1. Subscribers that exactly match the event name.
-          2. Subscribers with prefix patterns (ending in '.*') where the event name starts with the prefix.
+          2. Subscribers with prefix patterns (ending in '.*') whose prefix matches the leading
+             dot-separated segments of the event name ('mytool.*' matches 'mytool' and 'mytool.call').
 
         Args:
             event_name: The name of the event to publish.
             *args: Positional arguments to pass to the callbacks.
             **kwargs: Keyword arguments to pass to the callbacks.
 
+        Publishes made by callbacks while another publish or a flush is in progress are dispatched
+        right away, but leave the buffer flush to the outermost call, so a burst of nested publishes
+        costs a single pass over the buffer.
+
         Returns:
             True if any subscribers received the event, False otherwise.
             If no subscriber received the event, it is buffered.
         """
-        delivered = super().publish(event_name, *args, **kwargs)
-        if not delivered:
-            self._buffer.append((event_name, args, kwargs))
-        self._flush_buffer()
+        if self._pumping or self._flushing:
+            delivered = super().publish(event_name, *args, **kwargs)
+            if not delivered:
+                self._buffer_event(event_name, args, kwargs)
+            return delivered
+
+        self._pumping = True
+        try:
+            delivered = super().publish(event_name, *args, **kwargs)
+            if not delivered:
+                self._buffer_event(event_name, args, kwargs)
+            self._flush_buffer()
+        finally:
+            self._pumping = False
         return delivered
 
     def _flush_buffer(self, trim_prefix: Optional[str] = None) -> int:
         """Attempt to flush buffered events by re-publishing them.
 
+        Flushes requested by subscribers while a flush is running (e.g. a callback that subscribes)
+        are deferred and served by another pass once the current one is over.
+
         Args:
             trim_prefix: If provided, events with this prefix will be removed without dispatching.
 
         Returns:
             The number of events removed from the buffer.
         """
+        if self._flushing:
+            self._flush_requested = True
+            if trim_prefix:
+                self._deferred_trims.append(trim_prefix)
+            return 0
+
         removed_count = 0
-        buffer_size = len(self._buffer)
-        
-        # Process the current events; new events appended during processing will be handled later.
-        for _ in range(buffer_size):
-            if not self._buffer:
-                break
+        self._flushing = True
+        try:
+            while True:
+                self._flush_requested = False
+                removed_count += self._compact_buffer(trim_prefix)
+                if self._deferred_trims:
+                    trim_prefix = self._deferred_trims.pop(0)
+                elif self._flush_requested:
+                    trim_prefix = None
+                else:
+                    break
+        finally:
+            self._flushing = False
+            self._drop_overflow()
+        return removed_count
 
-            event_name, args, kwargs = self._buffer.popleft()
+    def _compact_buffer(self, trim_prefix: Optional[str] = None) -> int:
+        """Single flush pass: deliver or trim buffered events, compacting the survivors in place.
 
-            # If trim_prefix is specified and matches, remove this event.
-            if trim_prefix and event_name.startswith(trim_prefix):
-                removed_count += 1
-                continue
+        A read index walks the events buffered when the pass started, a write index trails it and
+        receives the events that are still undeliverable, so the buffer is never popped and re-appended.
+        Events buffered by callbacks during the pass are appended past the read range and kept as is.
 
-            # Try to dispatch the event.
-            if not super()._dispatch_event(event_name, *args, **kwargs):
-                # If still undeliverable, add it back.
-                self._buffer.append((event_name, args, kwargs))
-            else:
-                removed_count += 1
-        
-        return removed_count
+        Args:
+            trim_prefix: If provided, events with this prefix will be removed without dispatching.
+
+        Returns:
+            The number of events removed from the buffer.
+        """
+        buffer = self._buffer
+        pending = len(buffer)
+        read = 0
+        write = 0
+        try:
+            while read < pending:
+                record = buffer[read]
+
+                # If trim_prefix is specified and matches, remove this event.
+                if trim_prefix and record.name.startswith(trim_prefix):
+                    self._release_event(record)
+                    read += 1
+                    continue
+
+                # Cheap prefilter first: skip building the dispatch when nothing can match.
+                if self._has_subscribers(record.name) and \
+                        super()._dispatch_event(record.name, *record.args, **record.kwargs):
+                    self._release_event(record)
+                    read += 1
+                    continue
+
+                # Still undeliverable, keep it in order.
+                buffer[write] = record
+                write += 1
+                read += 1
+        finally:
+            # A raising subscriber stops the pass at 'read': that event and the unvisited ones are kept,
+            # moved down over the released slots so that only live records remain in the buffer.
+            for unvisited in range(read, pending):
+                buffer[write] = buffer[unvisited]
+                write += 1
+            del buffer[write:pending]
+        return pending - write
 
     def trim_by_prefix(self, prefix: str) -> int:
         """Remove all buffered events with a specific prefix without dispatching them.
@@ -1,8 +1,12 @@
+import hashlib
+import weakref
 from pathlib import Path
+import orjson
+import yaml
 from pydantic import Field, model_validator, BaseModel
 from typing import Optional, List, ClassVar, Tuple, Sequence, Callable, Dict, Union, Type, Any
 
-from just_agents.just_serialization import JustSerializable
+from just_agents.just_serialization import JustSerializable, JustYaml
 from just_agents.data_classes import ModelPromptExample
 from just_agents.just_tool import JustTool, JustTools, SubscriberCallback, JustPromptTool, JustPromptTools
 
@@ -243,6 +247,8 @@ class JustAgentProfile(JustSerializable, JustAgentProfileToolsetMixin):
     DEFAULT_GENERIC_PROMPT: ClassVar[str] = "You are a helpful AI assistant"
     DEFAULT_PARENT_SECTION: ClassVar[str] = None#'agent_profiles'
     DEFAULT_CONFIG_PATH: ClassVar[Path] = Path('./config/agent_profiles.yaml')
+    _LIVE_INSTANCES: ClassVar["weakref.WeakValueDictionary[bytes, JustAgentProfile]"] = weakref.WeakValueDictionary()
+    """Instances loaded with auto_load(reuse_live=True), keyed by a digest of their section, kept only while in use."""
     config_parent_section: Optional[str] = Field(DEFAULT_PARENT_SECTION, exclude=True)
 
     system_prompt: str = Field(
@@ -261,6 +267,7 @@ class JustAgentProfile(JustSerializable, JustAgentProfileToolsetMixin):
                 section_name: str,
                 parent_section: Optional[str] = None,
                 file_path: Path = None,
+                reuse_live: bool = False,
         ) -> JustSerializable:
         """
         Creates an instance from a YAML file.
@@ -273,6 +280,9 @@ class JustAgentProfile(JustSerializable, JustAgentProfileToolsetMixin):
             section_name (str): The section name in the YAML file.
             parent_section (Optional[str]): The parent section name in the YAML file.
             file_path (Path): The path to the YAML file.
+            reuse_live (bool): Return the instance an earlier reuse_live load built from an identical section
+                while it is still referenced, skipping validation and tool binding. Agents keep state such as
+                memory, so the instance is shared by all such callers.
 
         Returns:
             Any: An instance of the dynamically imported class if `class_qualname` is found in the
@@ -282,8 +292,31 @@ class JustAgentProfile(JustSerializable, JustAgentProfileToolsetMixin):
             parent_section = cls.DEFAULT_PARENT_SECTION
         if file_path is None:
             file_path = cls.DEFAULT_CONFIG_PATH
+        if not reuse_live:
+            return cls.from_yaml_auto(section_name, parent_section, file_path)
 
-        return cls.from_yaml_auto(section_name, parent_section, file_path)
+        try:
+            config_data = JustYaml.read_yaml_data_safe(file_path, section_name, parent_section)
+            if config_data is None:
+                return None
+            key = hashlib.blake2b(
+                orjson.dumps(
+                    # identical sections in other files or loaded through other classes are not interchangeable
+                    [f"{cls.__module__}.{cls.__qualname__}", str(Path(file_path).resolve()),
+                     section_name, parent_section, config_data],
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                ),
+                digest_size=16
+            ).digest()
+        except (TypeError, yaml.YAMLError):
+            # The section cannot be keyed (e.g. a !!set or !!binary value, or tuple keys), load it without reuse
+            return cls.from_yaml_auto(section_name, parent_section, file_path)
+        instance = cls._LIVE_INSTANCES.get(key)
+        if instance is None:
+            instance = cls.from_yaml_auto(section_name, parent_section, file_path)
+            if instance is not None:
+                cls._LIVE_INSTANCES[key] = instance
+        return instance
 
     @staticmethod
     def load_legacy_schema(
@@ -1,8 +1,11 @@
 import yaml
+import copy
 import importlib
+import mmap
 import sys
+from functools import lru_cache
 import importlib.util
-from typing import Optional, Dict, Any, ClassVar, Sequence, Union, Set, Type, TypeVar, Union, Callable, Type
+from typing import Optional, Dict, Any, ClassVar, Sequence, Union, Set, Type, TypeVar, Union, Callable, Type, List, Tuple
 from pathlib import Path
 import types
 from pydantic import BaseModel, Field, field_validator
@@ -10,6 +13,117 @@ from collections.abc import MutableMapping, MutableSequence
 from pydantic import BaseModel, Field, ConfigDict
 
 
+# Prefer the libyaml-backed loaders and dumper, fall back to pure Python if PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper, CFullLoader as FullLoader
+except ImportError:
+    from yaml import SafeLoader, SafeDumper, FullLoader
+
+_YAML_WHOLE_READ_LIMIT = 256 * 1024  # configs below this size are handed to the parser as a single bytes object
+
+def _map_yaml_file(f) -> mmap.mmap:
+    """Map an open YAML file read-only, asking the kernel to prefault all pages in one go where supported."""
+    if hasattr(mmap, "MAP_POPULATE"):  # Linux only
+        return mmap.mmap(f.fileno(), 0, flags=mmap.MAP_SHARED | mmap.MAP_POPULATE, prot=mmap.PROT_READ)
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+_YAML_MERGE_TAG = 'tag:yaml.org,2002:merge'
+_YAML_VALUE_TAG = 'tag:yaml.org,2002:value'
+
+def _has_merge_keys(root: Optional[yaml.Node]) -> bool:
+    """Whether any mapping of a composed document has << or = keys, which the constructor rewrites in place."""
+    stack = [root] if root is not None else []
+    seen = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:  # anchored nodes may be reached more than once
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if key_node.tag in (_YAML_MERGE_TAG, _YAML_VALUE_TAG):
+                    return True
+                stack.append(value_node)
+        elif isinstance(node, yaml.SequenceNode):
+            stack.extend(node.value)
+    return False
+
+@lru_cache(maxsize=64)
+def _compose_yaml_cached(resolved_path: str, mtime_ns: int, size: int, loader: Type) -> Tuple[Optional[yaml.Node], bool]:
+    """
+    Compose a YAML file into its node graph once per (path, modification time, size) and loader.
+    Python objects are only constructed later, for the subtree a caller asks for; the cached nodes are never mutated.
+    Returns the graph and whether it has merge keys, in which case subtrees are copied before construction.
+    """
+    # libyaml decodes bytes itself, binary reads skip Python's text-mode decoding layer
+    if size < _YAML_WHOLE_READ_LIMIT:
+        root = yaml.compose(Path(resolved_path).read_bytes(), Loader=loader)
+    else:
+        # large multi-agent configs are parsed straight from a memory map instead of through Python's file buffers
+        with open(resolved_path, 'rb') as f, _map_yaml_file(f) as mapped:
+            root = yaml.compose(mapped, Loader=loader)
+    return root, _has_merge_keys(root)
+
+def _compose_yaml_file(file_path: Path, loader: Type) -> Tuple[Optional[yaml.Node], bool]:
+    """Return the cached node graph of a YAML file, composing it again if the file changed on disk."""
+    stat = file_path.stat()
+    return _compose_yaml_cached(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, loader)
+
+def _copy_yaml_node(node: yaml.Node, memo: Optional[Dict[int, yaml.Node]] = None) -> yaml.Node:
+    """
+    Copy a composed node and everything below it, so the constructor can flatten merge keys
+    without rewriting the cached graph. Anchored nodes stay shared within the copy, marks are not copied.
+    """
+    if memo is None:
+        memo = {}
+    copied = memo.get(id(node))
+    if copied is not None:
+        return copied
+    copied = copy.copy(node)
+    memo[id(node)] = copied
+    if isinstance(node, yaml.MappingNode):
+        copied.value = [(_copy_yaml_node(key, memo), _copy_yaml_node(value, memo)) for key, value in node.value]
+    elif isinstance(node, yaml.SequenceNode):
+        copied.value = [_copy_yaml_node(value, memo) for value in node.value]
+    return copied
+
+def _yaml_mapping_pairs(node: yaml.MappingNode, loader: Type) -> List[tuple]:
+    """The key/value node pairs of a mapping with its << merge keys resolved, the cached node is left as is."""
+    if not any(key_node.tag == _YAML_MERGE_TAG for key_node, _ in node.value):
+        return node.value
+    flattened = _copy_yaml_node(node)
+    constructor = loader("")
+    try:
+        constructor.flatten_mapping(flattened)
+    finally:
+        constructor.dispose()
+    return flattened.value
+
+def _find_yaml_node(node: Optional[yaml.Node], keys: Sequence[str], loader: Type) -> Optional[yaml.Node]:
+    """Follow mapping keys down a composed document, returns None if any key along the way is missing."""
+    for key in keys:
+        if not isinstance(node, yaml.MappingNode):
+            return None
+        # the last occurrence wins, as it does when the whole mapping is constructed
+        node = next((value for key_node, value in reversed(_yaml_mapping_pairs(node, loader)) if key_node.value == key), None)
+    return node
+
+def _construct_yaml_node(node: Optional[yaml.Node], loader: Type, has_merge_keys: bool) -> Any:
+    """Build fresh Python objects for a composed node and everything below it."""
+    if node is None:
+        return None
+    if has_merge_keys:
+        node = _copy_yaml_node(node)  # constructing flattens merge keys in place
+    constructor = loader("")
+    try:
+        return constructor.construct_object(node, deep=True)
+    finally:
+        constructor.dispose()
+
+def clear_config_cache() -> None:
+    """Forget all parsed YAML files, e.g. between tests that rewrite configs in place."""
+    _compose_yaml_cached.cache_clear()
+
 # Create a TypeVar for the class
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -21,6 +135,15 @@ class JustYaml:
     A utility static class for reading and saving data to YAML files.
 
     Methods:
+        load_yaml_file(file_path: Path, loader: Type = SafeLoader) -> Any:
+            Reads a whole YAML file, parsing it again only when the file changes.
+
+        load_yaml_section(file_path: Path, *keys: str, loader: Type = SafeLoader) -> Any:
+            Reads one nested section of a YAML file, constructing only that subtree.
+
+        yaml_section_keys(file_path: Path, *keys: str) -> List[str]:
+            Lists the keys of a nested mapping without constructing its values.
+
         read_yaml_data(file_path: Path, section_name: str, parent_section: str = DEFAULT_AGENT_PROFILES_SECTION) -> Dict:
             Reads data from a given section within a YAML file.
 
@@ -41,6 +164,61 @@ class JustYaml:
             return dumper.represent_scalar('tag:yaml.org,2002:str', fixed_data, style='|')
         return dumper.represent_scalar('tag:yaml.org,2002:str', data)
 
+    @staticmethod
+    def load_yaml_file(file_path: Path, loader: Type = SafeLoader) -> Any:
+        """
+        Reads a whole YAML file, reusing the parsed data while the file is unchanged on disk.
+
+        Args:
+            file_path (Path): The path to the YAML file.
+            loader (Type): The PyYAML loader class to parse it with. Defaults to the safe loader.
+
+        Returns:
+            Any: A private copy of the parsed file contents, safe to modify.
+        """
+        root, has_merge_keys = _compose_yaml_file(file_path, loader)
+        return _construct_yaml_node(root, loader, has_merge_keys)
+
+    @staticmethod
+    def load_yaml_section(file_path: Path, *keys: str, loader: Type = SafeLoader) -> Any:
+        """
+        Reads a single nested section of a YAML file without constructing the rest of the document.
+
+        Args:
+            file_path (Path): The path to the YAML file.
+            *keys (str): The mapping keys leading to the section, e.g. parent section and section name.
+            loader (Type): The PyYAML loader class to parse it with. Defaults to the safe loader.
+
+        Returns:
+            Any: A private copy of the section contents, safe to modify.
+
+        Raises:
+            KeyError: If any of the keys is not found.
+        """
+        root, has_merge_keys = _compose_yaml_file(file_path, loader)
+        node = _find_yaml_node(root, keys, loader)
+        if node is None:
+            raise KeyError(".".join(keys))
+        return _construct_yaml_node(node, loader, has_merge_keys)
+
+    @staticmethod
+    def yaml_section_keys(file_path: Path, *keys: str) -> List[str]:
+        """
+        Lists the keys of a nested mapping in a YAML file without constructing its values.
+
+        Args:
+            file_path (Path): The path to the YAML file.
+            *keys (str): The mapping keys leading to the section, none for the top level.
+
+        Returns:
+            List[str]: The keys of the section, empty if it is missing or not a mapping.
+        """
+        root, _ = _compose_yaml_file(file_path, SafeLoader)
+        node = _find_yaml_node(root, keys, SafeLoader)
+        if not isinstance(node, yaml.MappingNode):
+            return []
+        return list(dict.fromkeys(key_node.value for key_node, _ in _yaml_mapping_pairs(node, SafeLoader)))
+
     @staticmethod
     def read_yaml_data(
             file_path: Path,
@@ -61,19 +239,14 @@ class JustYaml:
         Raises:
             ValueError: If the section or parent section is not found in the YAML file.
         """
-        if file_path.exists():
-            with file_path.open('r') as f:
-                data = yaml.load(f, Loader=yaml.FullLoader) or {}
-        else:
+        if not file_path.exists():
             raise FileNotFoundError(
                 f"File '{file_path}' not found."
             )
+        keys = (parent_section, section_name) if parent_section else (section_name,)
         try:
-            # Retrieve the data for the specified section
-            if parent_section:
-                return data[parent_section][section_name]
-            else:
-                return data[section_name]
+            # Construct only the specified section, the rest of the file is merely composed
+            return JustYaml.load_yaml_section(file_path, *keys, loader=FullLoader)
         except KeyError as e:
             raise KeyError(
                 f"Section '{section_name}' under parent section '{parent_section}' not found in '{file_path}'"
@@ -96,25 +269,20 @@ class JustYaml:
         Returns:
             Optional[Dict]: The data from the specified section, or None if not found or error occurred while reading.
         """
-        if file_path.exists():
-            with file_path.open('r') as f:
-                data = yaml.safe_load(f) or {}
-        else:
+        if not file_path.exists():
             return None
-        try:
-            # Retrieve the data for the specified section
-            if parent_section:
-                if parent_section in data:
-                    if section_name and section_name in data[parent_section]:
-                        return data[parent_section][section_name]
-            elif section_name and section_name in data:
-                return data[section_name]
-            elif not section_name and data:
-                return data
-            else:
+        if parent_section:
+            if not section_name:
                 return None
+            keys = (parent_section, section_name)
+        else:
+            keys = (section_name,) if section_name else ()
+        try:
+            # Construct only the specified section, the rest of the file is merely composed
+            data = JustYaml.load_yaml_section(file_path, *keys)
         except KeyError:
             return None
+        return data if keys or data else None
 
     @staticmethod
     def save_to_yaml(
@@ -139,9 +307,8 @@ class JustYaml:
         data = {}
         # Check if the YAML file exists and load existing data
         if file_path.exists():
-            with file_path.open('r') as f:
-                existing_data = dict(yaml.safe_load(f) or {})
-                data.update(existing_data)
+            existing_data = dict(JustYaml.load_yaml_file(file_path) or {})
+            data.update(existing_data)
         else:
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -156,14 +323,17 @@ class JustYaml:
 
         # Write the updated data back to the YAML file
         with file_path.open('w') as f:
-            yaml.safe_dump(data, f)
+            yaml.dump(data, f, Dumper=SafeDumper)
             #yaml.safe_dump(data, f)
+        clear_config_cache()  # do not rely on the file timestamp alone for a file we just rewrote
 
 
 # configure YAML to use fixed representer:
 yaml.add_representer(str, JustYaml.str_presenter)
 # to use with safe_dump:
 yaml.representer.SafeRepresenter.add_representer(str, JustYaml.str_presenter)
+# and with the dumper used by save_to_yaml, in case it keeps its own representers table:
+SafeDumper.add_representer(str, JustYaml.str_presenter)
 
 class JustSerializable(BaseModel):
     """
@@ -2,7 +2,10 @@ from typing import Callable, Optional, List, Dict, Any, Sequence, Union, TypeVar
 from pydantic import BaseModel, Field, PrivateAttr
 from just_agents.just_bus import JustToolsBus, VariArgs, SubscriberCallback
 from importlib import import_module
+import hashlib
 import inspect
+import weakref
+from copy import deepcopy
 from docstring_parser import parse
 from pydantic import ConfigDict
 import sys
@@ -15,6 +18,57 @@ if sys.version_info >= (3, 11):
 else:
     Self = TypeVar('Self', bound='JustTool')
 
+CallableFingerprint = Tuple[Any, Optional[str], Optional[tuple], Optional[dict]]
+"""Parts of a function that its LLM description depends on: (code, docstring, defaults, keyword defaults)."""
+
+_SCHEMA_EXTRACTOR_VERSION = 1
+"""Part of every schema_fingerprint, bump it whenever _build_llm_dict changes its output so saved descriptions are rebuilt."""
+
+_LLM_DICT_CACHE: "weakref.WeakKeyDictionary[Callable, Tuple[CallableFingerprint, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+"""Function descriptions already extracted via inspect and docstring parsing, keyed weakly by the function."""
+
+class _ToolInvoker:
+    """
+    Callable wrapper of a tool function that publishes execute/result/error events to JustToolsBus.
+    The bus instance and the event names are resolved once, when the tool is (re)wrapped, not on every call.
+    """
+    __slots__ = ('tool', 'func', 'name', 'bus', 'ev_exec', 'ev_res', 'ev_err')
+
+    def __init__(self, tool: 'JustTool', func: Callable, name: str) -> None:
+        self.tool = tool
+        self.func = func
+        self.name = name
+        self.bus = JustToolsBus()
+        event_prefix = f"{name}.{id(tool)}"
+        # interned like the bus subscription keys, so every publish matches them by identity
+        self.ev_exec = sys.intern(f"{event_prefix}.execute")
+        self.ev_res = sys.intern(f"{event_prefix}.result")
+        self.ev_err = sys.intern(f"{event_prefix}.error")
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        bus = self.bus
+        tool = self.tool
+        bus.publish(self.ev_exec, *args, kwargs=kwargs)
+
+        try:
+            # Check for maximum calls
+            if tool.max_calls_per_query is not None:
+                if tool._calls_made >= tool.max_calls_per_query:
+                    error = RuntimeError(f"Maximum number of calls ({tool.max_calls_per_query}) reached for {self.name}")
+                    bus.publish(self.ev_err, error=error)
+                    raise error
+
+            # Execute function and record call
+            result = self.func(*args, **kwargs)
+            tool._calls_made += 1
+
+            bus.publish(self.ev_res, result_interceptor=result, kwargs=kwargs)
+            return result
+        except Exception as e:
+            bus.publish(self.ev_err, error=e)
+            raise e
+
+
 class LiteLLMDescription(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
@@ -26,6 +80,7 @@ class JustTool(LiteLLMDescription):
     package: str = Field(..., description="The name of the module where the function is located.")
     auto_refresh: bool = Field(True, description="Whether to automatically refresh the tool after initialization.")
     max_calls_per_query: Optional[int] = Field(None, ge=1, description="The maximum number of calls to the function per query.")
+    schema_fingerprint: Optional[str] = Field(None, description="Digest of the function signature and docstring the description and parameters were built from.")
     model_config = ConfigDict(
         extra="allow",
     )
@@ -36,6 +91,8 @@ class JustTool(LiteLLMDescription):
     """The original callable function."""
     _calls_made: int = PrivateAttr(default=0)
     """Counter for tracking how many times this tool has been called."""
+    _schema_source: Tuple[Any, ...] = PrivateAttr(default=())
+    """The description and parameters known to match schema_fingerprint, reassigning either invalidates them."""
 
     @property
     def remaining_calls(self) -> int:
@@ -59,6 +116,9 @@ class JustTool(LiteLLMDescription):
     def model_post_init(self, __context: Any) -> None:
         """Called after the model is initialized. Refreshes the tools meta-info if auto_refresh is True."""
         super().model_post_init(__context)
+        if self.schema_fingerprint is not None:
+            # a saved description comes with the fingerprint it was built for, refresh only rebuilds it if the function changed
+            self._schema_source = (self.description, self.parameters)
         if self.auto_refresh:
             self.refresh()
         if self._callable is None or self._raw_callable is None:
@@ -67,38 +127,87 @@ class JustTool(LiteLLMDescription):
     def _wrap_function(self, func: Callable, name: str) -> Callable:
         """
         Helper to wrap a function with event publishing logic to JustToolsBus.
+        The current wrapper is reused while it already wraps the same function under the same name,
+        so refreshing a tool does not leave callers holding a stale invoker.
         """
-        def __wrapper(*args: Any, **kwargs: Any) -> Any:
-            bus = JustToolsBus()
-            bus.publish(f"{name}.{id(self)}.execute", *args, kwargs=kwargs)
-            
-            try:
-                # Check for maximum calls
-                if self.max_calls_per_query is not None:
-                    if self._calls_made >= self.max_calls_per_query:
-                        error = RuntimeError(f"Maximum number of calls ({self.max_calls_per_query}) reached for {name}")
-                        bus.publish(f"{name}.{id(self)}.error", error=error)
-                        raise error
-                
-                # Execute function and record call
-                result = func(*args, **kwargs)
-                self._calls_made += 1
-                
-                bus.publish(f"{name}.{id(self)}.result", result_interceptor=result, kwargs=kwargs)
-                return result
-            except Exception as e:
-                bus.publish(f"{name}.{id(self)}.error", error=e)
-                raise e
-        return __wrapper
+        current = self._callable
+        if isinstance(current, _ToolInvoker) and current.tool is self and current.func is func and current.name == name:
+            return current
+        return _ToolInvoker(self, func, name)
+
+    @staticmethod
+    def _callable_fingerprint(input_function: Callable) -> CallableFingerprint:
+        """
+        Fingerprint the parts of a function its description is built from.
+        A reloaded or redefined function gets a new code object, so a stale cache entry never matches.
+        """
+        return (
+            getattr(input_function, '__code__', None),
+            getattr(input_function, '__doc__', None),
+            getattr(input_function, '__defaults__', None),
+            getattr(input_function, '__kwdefaults__', None),
+        )
+
+    @staticmethod
+    def _schema_fingerprint(input_function: Callable) -> Optional[str]:
+        """
+        Digest the name, docstring and signature of a function, but not its body.
+        Unlike the in-process cache key it is stable across restarts, so it is saved along with the description.
+        Returns None for callables without a code object, their description is always rebuilt.
+        """
+        target = inspect.unwrap(input_function)  # signatures of decorated functions come from the wrapped one
+        code = getattr(target, '__code__', None)
+        if code is None:
+            return None
+        arg_count = (code.co_argcount + code.co_kwonlyargcount
+                     + bool(code.co_flags & inspect.CO_VARARGS) + bool(code.co_flags & inspect.CO_VARKEYWORDS))
+        parts = (
+            _SCHEMA_EXTRACTOR_VERSION,
+            getattr(input_function, '__name__', None),
+            getattr(input_function, '__doc__', None),
+            code.co_varnames[:arg_count],
+            getattr(target, '__annotations__', None),
+            getattr(target, '__defaults__', None),
+            getattr(target, '__kwdefaults__', None),
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()[:16]
 
     @staticmethod
     def function_to_llm_dict(input_function: Callable) -> Dict[str, Any]:
         """
         Extract function metadata for function calling format without external dependencies.
+        Results are cached per function, so tools built repeatedly from the same callable
+        (e.g. when agents are reloaded) skip inspect.signature and docstring parsing.
         
         Args:
             input_function: The function to extract metadata from
             
+        Returns:
+            Dict with function name, description and parameters
+        """
+        fingerprint = JustTool._callable_fingerprint(input_function)
+        try:
+            cached = _LLM_DICT_CACHE.get(input_function)
+        except TypeError:  # not weak-referenceable or not hashable, e.g. some callable instances
+            cached = None
+        if cached is not None and cached[0] == fingerprint:
+            return deepcopy(cached[1])  # callers are free to mutate their copy
+
+        result = JustTool._build_llm_dict(input_function)
+        try:
+            _LLM_DICT_CACHE[input_function] = (fingerprint, result)
+        except TypeError:
+            return result
+        return deepcopy(result)
+
+    @staticmethod
+    def _build_llm_dict(input_function: Callable) -> Dict[str, Any]:
+        """
+        Build the function calling description of a function via inspect and docstring parsing.
+
+        Args:
+            input_function: The function to extract metadata from
+
         Returns:
             Dict with function name, description and parameters
         """
@@ -223,7 +332,8 @@ class JustTool(LiteLLMDescription):
             by_alias=False,
             exclude_none=True,
             serialize_as_any=False,
-            include=set(self.__class__.__bases__[0].model_fields) #Deprecated until v3, blame pydantic for warnings
+            # schema_fingerprint is bookkeeping for refresh, subclasses inheriting it must not send it to the LLM
+            include=set(self.__class__.__bases__[0].model_fields) - {"schema_fingerprint"} #Deprecated until v3, blame pydantic for warnings
         )
         return dump
 
@@ -247,7 +357,8 @@ class JustTool(LiteLLMDescription):
 
         return cls(
             **litellm_description,
-            package=package
+            package=package,
+            schema_fingerprint=cls._schema_fingerprint(input_function)
         )
 
     def subscribe(self, callback: SubscriberCallback, type: Optional[str]=None) -> bool:
@@ -318,6 +429,8 @@ class JustTool(LiteLLMDescription):
         """
         Refresh the JustTool instance to reflect the current state of the actual function.
         Updates package, function name, description, parameters, and ensures the function is importable.
+        Description and parameters are only rebuilt if the function no longer matches schema_fingerprint
+        or either of them was reassigned since.
         
         Returns:
             JustTool: Returns self to allow method chaining or direct appending.
@@ -326,14 +439,23 @@ class JustTool(LiteLLMDescription):
             # Get the function from the module
             func = getattr(import_module(self.package), self.name)
             
-            # Use our own implementation to get function metadata
-            litellm_description = self.function_to_llm_dict(func)
-            
-            # Update the description
-            self.description = litellm_description.get("description")
-            
-            # Update parameters
-            self.parameters = litellm_description.get("parameters")
+            fingerprint = self._schema_fingerprint(func)
+            if (
+                fingerprint is None
+                or fingerprint != self.schema_fingerprint
+                or not self._schema_source
+                or any(value is not known for value, known in zip((self.description, self.parameters), self._schema_source))
+            ):
+                # Use our own implementation to get function metadata
+                litellm_description = self.function_to_llm_dict(func)
+
+                # Update the description
+                self.description = litellm_description.get("description")
+
+                # Update parameters
+                self.parameters = litellm_description.get("parameters")
+                self.schema_fingerprint = fingerprint
+                self._schema_source = (self.description, self.parameters)
             
             # Rewrap with the updated callable
             self._callable = self._wrap_function(func, self.name)
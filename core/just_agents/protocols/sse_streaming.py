@@ -1,5 +1,5 @@
 from typing import Any, Union, Optional, Dict
-import json
+import orjson
 
 class ServerSentEventsStream:
     # https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events/Using_server-sent_events#event_stream_format
@@ -46,8 +46,8 @@ class ServerSentEventsStream:
         if isinstance(data, str):
             lines.append(f"data: {data}")
         elif isinstance(data, dict):
-            # Serialize dictionaries to JSON
-            lines.append(f"data: {json.dumps(data)}")
+            # Serialize dictionaries to compact JSON
+            lines.append(f"data: {orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()}")
         else:
             raise NotImplementedError("Data type not supported by the SSE protocol.")
 
@@ -109,8 +109,8 @@ class ServerSentEventsStream:
 
         # Attempt to parse the data as JSON
         try:
-            parsed_data = json.loads(raw_data)
-        except json.JSONDecodeError:
+            parsed_data = orjson.loads(raw_data)
+        except orjson.JSONDecodeError:
             parsed_data = raw_data
 
         return {
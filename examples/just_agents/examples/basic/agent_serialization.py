@@ -26,13 +26,14 @@ if __name__ == "__main__":
     )
 
     created_agent.save_to_yaml("SimpleWeatherAgent")
+    created_profile = created_agent.to_json()  # a plain dict, serialized once and compared against both loads
 
     #auto load example
     agent_auto = JustAgentProfile.auto_load("SimpleWeatherAgent", file_path=config_path)
     print(agent_auto)
     assert isinstance(agent_auto, JustAgentProfile) #just testing that types are correct
     assert isinstance(agent_auto, BaseAgent)
-    assert agent_auto.to_json() == created_agent.to_json()
+    assert agent_auto.to_json() == created_profile
     res = agent_auto.query("What's the weather like in San Francisco, Tokyo, and Paris?")
     print("===============")
     print(res)
@@ -43,7 +44,7 @@ if __name__ == "__main__":
     print(agent)
     assert isinstance(agent, JustAgentProfile)
     assert isinstance(agent, BaseAgent)
-    assert agent.to_json() == created_agent.to_json()
+    assert agent.to_json() == created_profile
     res = agent.query("What's the weather like in San Francisco, Tokyo, and Paris?")
     print(res)
     #print(agent.to_json())
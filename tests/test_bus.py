@@ -0,0 +1,300 @@
+import threading
+import time
+from typing import Any, List, Tuple
+
+from just_agents.just_bus import JustEventBus, BufferedEventBus
+
+
+def make_recorder() -> Tuple[List[Tuple[str, Any]], Any]:
+    received: List[Tuple[str, Any]] = []
+
+    def callback(event_name: str, *args: Any, **kwargs: Any) -> None:
+        received.append((event_name, kwargs.get("value")))
+
+    return received, callback
+
+
+def test_exact_and_prefix_dispatch():
+    class ExactBus(JustEventBus):
+        pass
+
+    bus = ExactBus()
+    exact, exact_cb = make_recorder()
+    prefixed, prefix_cb = make_recorder()
+    bus.subscribe("tool.42.result", exact_cb)
+    bus.subscribe("tool.*", prefix_cb)
+
+    assert bus.publish("tool.42.result", value=1)
+    assert bus.publish("tool", value=2)
+    assert not bus.publish("toolbox.42.result", value=3)  # prefixes match whole segments only
+    assert not bus.publish("other.42.result", value=4)
+
+    assert exact == [("tool.42.result", 1)]
+    assert prefixed == [("tool.42.result", 1), ("tool", 2)]
+
+
+def test_global_wildcard_and_deduplication():
+    class DedupBus(JustEventBus):
+        pass
+
+    bus = DedupBus()
+    received, callback = make_recorder()
+    bus.subscribe(".*", callback)
+    bus.subscribe("tool.*", callback)
+    bus.subscribe("tool.call", callback)
+
+    assert bus.publish("tool.call", value=1)
+    assert bus.publish("anything", value=2)
+    assert received == [("tool.call", 1), ("anything", 2)]
+
+
+def test_unsubscribe_prunes_index():
+    class PruneBus(JustEventBus):
+        pass
+
+    bus = PruneBus()
+    received, callback = make_recorder()
+    bus.subscribe("a.b.c", callback)
+    bus.subscribe("a.b.*", callback)
+
+    assert bus.unsubscribe("a.b.c", callback)
+    assert not bus.unsubscribe("a.b.c", callback)
+    assert bus.publish("a.b.c", value=1)  # still delivered through the wildcard
+    assert bus.unsubscribe("a.b.*", callback)
+    assert not bus.publish("a.b.c", value=2)
+
+    assert received == [("a.b.c", 1)]
+    assert not bus._subscribers
+    assert not bus._trie.children
+
+
+def test_buffered_bus_replays_in_order():
+    class ReplayBus(BufferedEventBus):
+        pass
+
+    bus = ReplayBus(buffer_size=3)
+    for i in range(5):
+        assert not bus.publish("log.source", value=i)
+
+    received, callback = make_recorder()
+    bus.subscribe("log.*", callback)
+    assert received == [("log.source", 2), ("log.source", 3), ("log.source", 4)]  # oldest were dropped
+
+    assert bus.publish("log.source", value=5)
+    assert received[-1] == ("log.source", 5)
+
+
+def test_buffered_bus_trim_by_prefix():
+    class TrimBus(BufferedEventBus):
+        pass
+
+    bus = TrimBus()
+    bus.publish("keep.me", value=1)
+    bus.publish("drop.me", value=2)
+    assert bus.trim_by_prefix("drop") == 1
+
+    received, callback = make_recorder()
+    bus.subscribe("drop.*", callback)
+    bus.subscribe("keep.*", callback)
+    assert received == [("keep.me", 1)]
+
+
+def test_reentrant_publish_keeps_deduplication():
+    class ReentrantBus(JustEventBus):
+        pass
+
+    bus = ReentrantBus()
+    calls: List[str] = []
+
+    def outer(event_name: str, *args: Any, **kwargs: Any) -> None:
+        calls.append(f"outer:{event_name}")
+        bus.publish("inner.event")
+
+    def shared(event_name: str, *args: Any, **kwargs: Any) -> None:
+        calls.append(f"shared:{event_name}")
+
+    bus.subscribe("outer.event", outer)
+    bus.subscribe("outer.event", shared)
+    bus.subscribe("outer.*", shared)
+    bus.subscribe("inner.*", shared)
+
+    assert bus.publish("outer.event")
+    assert calls == ["outer:outer.event", "shared:inner.event", "shared:outer.event"]
+
+
+def test_callback_ids_are_recycled():
+    class RecycleBus(JustEventBus):
+        pass
+
+    bus = RecycleBus()
+    _, first = make_recorder()
+    _, second = make_recorder()
+    bus.subscribe("a.*", first)
+    bus.subscribe("a.b", first)
+    first_id = bus._callback_ids[first]
+    bus.unsubscribe("a.*", first)
+    assert bus._callback_ids[first] == first_id  # still referenced by 'a.b'
+    bus.unsubscribe("a.b", first)
+    assert first not in bus._callback_ids
+
+    bus.subscribe("c", second)
+    assert bus._callback_ids[second] == first_id
+
+
+def test_buffered_records_are_pooled():
+    class PoolBus(BufferedEventBus):
+        pass
+
+    bus = PoolBus(buffer_size=2)
+    for i in range(4):
+        bus.publish("pooled.event", value=i)
+    assert len(bus._buffer) == 2
+    assert len(bus._pool) == 0
+
+    received, callback = make_recorder()
+    bus.subscribe("pooled.event", callback)
+    assert received == [("pooled.event", 2), ("pooled.event", 3)]
+    assert len(bus._pool) == 2
+    assert all(record.name is None and not record.kwargs for record in bus._pool)
+
+
+def test_raising_subscriber_leaves_the_buffer_consistent():
+    class RaisingBus(BufferedEventBus):
+        pass
+
+    bus = RaisingBus()
+    for name in ("x.1", "a.1", "a.2", "a.3"):
+        bus.publish(name, value=name)
+
+    received: List[str] = []
+
+    def callback(event_name: str, *args: Any, **kwargs: Any) -> None:
+        if event_name == "a.3":
+            raise RuntimeError("boom")
+        received.append(event_name)
+
+    try:
+        bus.subscribe("a.*", callback)
+    except RuntimeError:
+        pass
+    assert received == ["a.1", "a.2"]
+    assert [record.name for record in bus._buffer] == ["x.1", "a.3"]
+
+    bus.unsubscribe("a.*", callback)
+    bus.publish("x.2", value="x.2")  # must not trip over released records
+    x_received, x_callback = make_recorder()
+    bus.subscribe("x.*", x_callback)
+    assert x_received == [("x.1", "x.1"), ("x.2", "x.2")]
+
+
+def test_subscribe_during_flush_triggers_another_pass():
+    class NestedFlushBus(BufferedEventBus):
+        pass
+
+    bus = NestedFlushBus()
+    bus.publish("late.event", value=1)
+    bus.publish("early.event", value=2)
+    late, late_cb = make_recorder()
+
+    def early_cb(event_name: str, *args: Any, **kwargs: Any) -> None:
+        bus.subscribe("late.event", late_cb)  # "late.event" was already passed over in this flush
+
+    bus.subscribe("early.event", early_cb)
+    assert late == [("late.event", 1)]
+    assert not bus._buffer
+
+
+def test_wildcard_scan_and_trie_agree():
+    class ScanBus(JustEventBus):
+        pass
+
+    class TrieBus(JustEventBus):
+        pass
+
+    few = ScanBus()
+    many = TrieBus()
+    few_received, few_cb = make_recorder()
+    many_received, many_cb = make_recorder()
+    for pattern in ["a.b.*", ".*", "a.*"]:
+        few.subscribe(pattern, few_cb)
+        many.subscribe(pattern, many_cb)
+    for i in range(20):
+        many.subscribe(f"noise{i}.*", make_recorder()[1])
+    assert len(many._wildcard_patterns) > 8
+
+    for name in ["a.b.c", "a.bc", "a", "zzz"]:
+        assert few.publish(name, value=name)
+        assert many.publish(name, value=name)
+        assert len(few._matching_wildcards(name)) == len(many._matching_wildcards(name))
+    assert few_received == many_received
+    assert [depth for depth, *_ in many._wildcard_patterns] == sorted(depth for depth, *_ in many._wildcard_patterns)
+
+
+def test_singleton_is_created_once_across_threads():
+    created: List[int] = []
+
+    class RacyBus(JustEventBus):
+        def __init__(self) -> None:
+            created.append(threading.get_ident())
+            time.sleep(0.01)  # widen the window between lookup and registration
+            super().__init__()
+
+    instances: List[JustEventBus] = []
+    threads = [threading.Thread(target=lambda: instances.append(RacyBus())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
+def test_nested_publishes_share_one_flush():
+    class PumpBus(BufferedEventBus):
+        passes = 0
+
+        def _compact_buffer(self, trim_prefix=None):
+            PumpBus.passes += 1
+            return super()._compact_buffer(trim_prefix)
+
+    bus = PumpBus()
+    heard, heard_cb = make_recorder()
+
+    def burst(event_name: str, *args: Any, **kwargs: Any) -> None:
+        for i in range(50):
+            bus.publish("unheard.event", value=i)
+            bus.publish("heard.event", value=i)
+
+    bus.subscribe("heard.event", heard_cb)
+    bus.subscribe("burst.start", burst)
+    PumpBus.passes = 0
+
+    assert bus.publish("burst.start")
+    assert PumpBus.passes == 1
+    assert heard == [("heard.event", i) for i in range(50)]  # nested publishes are still delivered synchronously
+    assert len(bus._buffer) == 50
+
+    received, callback = make_recorder()
+    bus.subscribe("unheard.*", callback)
+    assert received == [("unheard.event", i) for i in range(50)]
+
+
+def test_publish_tolerates_a_concurrent_subscription():
+    class RaceBus(JustEventBus):
+        pass
+
+    bus = RaceBus()
+    received, callback = make_recorder()
+    bus.subscribe("race.*", lambda event_name, *args, **kwargs: None)
+    bus.publish("race.event", value=0)  # sizes this thread's seen array
+    next_generation = bus._next_generation
+
+    def racing_generation():
+        generation = next_generation()
+        bus.subscribe("race.*", callback)  # as if another thread subscribed right after seen was sized
+        return generation
+
+    bus._next_generation = racing_generation
+    assert bus.publish("race.event", value=1)
+    assert received == [("race.event", 1)]
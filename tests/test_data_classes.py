@@ -0,0 +1,40 @@
+import pytest
+
+from just_agents.data_classes import ImageContent, Message, TextContent, ToolCall
+
+
+@pytest.mark.parametrize("arguments, expected", [
+    ('{"location": "Paris"}', {"location": "Paris"}),
+    (b' {"days": [1, 2]} ', {"days": [1, 2]}),
+    ('{"location": "Par', {}),  # truncated arguments fall back to the partial parser
+    ({"location": "Tokyo"}, {"location": "Tokyo"}),
+])
+def test_tool_call_arguments(arguments, expected):
+    call = ToolCall(id="call_1", function={"name": "get_current_weather", "arguments": arguments})
+    assert call.arguments == expected
+
+
+def test_tool_call_invalid_arguments_are_reported():
+    call = ToolCall(id="call_1", function={"name": "get_current_weather", "arguments": "{bad}"})
+    assert isinstance(call.arguments, str)
+
+
+def test_message_get_text():
+    message = Message(role="user", content=[
+        TextContent(text="What is"),
+        ImageContent(image_url="https://example.com/cat.png"),
+        TextContent(text="in the picture?"),
+    ])
+    assert message.get_text() == "What is in the picture?"
+    assert message.get_text("\n", preserve_trailing=True) == "What is\nin the picture?\n"
+    assert Message(role="user", content="plain").get_text() == "plain"
+    assert Message(role="user", content=[]).get_text(preserve_trailing=True) == ""
+
+
+def test_message_text_format():
+    message = Message(role="user", content=[TextContent(text="Hello"), TextContent(text="world")])
+    formatted = message.text_format()
+    assert formatted.content == "Hello world"
+    assert formatted.role == "user"
+    assert isinstance(message.content, list)  # the original is untouched
+    assert formatted.model_dump(exclude_unset=True) == {"role": "user", "content": "Hello world"}
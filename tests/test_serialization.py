@@ -70,3 +70,128 @@ def test_just_agent(load_env, tmp_path):
 
     # Optionally, print the JSON representation
     print(loaded_agent.to_json())
+
+def test_yaml_roundtrip_keeps_block_prompts(tmp_path):
+    from just_agents.just_serialization import JustYaml
+
+    config = tmp_path / "agents.yaml"
+    profile = {"system_prompt": "You are helpful.   \nAnswer briefly.\n", "temperature": 0.5}
+    JustYaml.save_to_yaml(config, profile, "assistant", parent_section="agent_profiles")
+    JustYaml.save_to_yaml(config, {"temperature": 0.1}, "critic", parent_section="agent_profiles")
+
+    assert "system_prompt: |-" in config.read_text()  # multiline prompts are written as block scalars
+    assert JustYaml.read_yaml_data(config, "assistant", "agent_profiles") == {
+        "system_prompt": "You are helpful.\nAnswer briefly.", "temperature": 0.5
+    }
+    assert JustYaml.read_yaml_data_safe(config, "critic", "agent_profiles") == {"temperature": 0.1}
+
+def test_yaml_files_are_parsed_once_until_changed(tmp_path):
+    from just_agents.just_serialization import JustYaml, _compose_yaml_cached, clear_config_cache
+
+    clear_config_cache()
+    config = tmp_path / "agents.yaml"
+    config.write_text("agent_profiles:\n  assistant:\n    temperature: 0.5\n")
+
+    first = JustYaml.load_yaml_file(config)
+    first["agent_profiles"]["assistant"]["temperature"] = 1.0  # callers receive their own copy
+    assert JustYaml.read_yaml_data_safe(config, "assistant", "agent_profiles") == {"temperature": 0.5}
+    assert _compose_yaml_cached.cache_info().misses == 1
+
+    config.write_text("agent_profiles:\n  assistant:\n    temperature: 0.25\n")
+    assert JustYaml.read_yaml_data_safe(config, "assistant", "agent_profiles") == {"temperature": 0.25}
+
+def test_large_yaml_files_are_streamed(tmp_path, monkeypatch):
+    import just_agents.just_serialization as serialization
+
+    config = tmp_path / "agents.yaml"
+    config.write_text("agent_profiles:\n  assistant:\n    description: \"Grüße\"\n", encoding="utf-8")
+    assert serialization.JustYaml.read_yaml_data(config, "assistant", "agent_profiles") == {"description": "Grüße"}
+
+    monkeypatch.setattr(serialization, "_YAML_WHOLE_READ_LIMIT", 0)
+    serialization.clear_config_cache()
+    assert serialization.JustYaml.read_yaml_data(config, "assistant", "agent_profiles") == {"description": "Grüße"}
+
+def test_yaml_sections_are_constructed_on_demand(tmp_path):
+    from just_agents.just_serialization import JustYaml
+
+    config = tmp_path / "agents.yaml"
+    config.write_text(
+        "agent_profiles:\n"
+        "  assistant:\n"
+        "    temperature: &temp 0.5\n"
+        "  critic:\n"
+        "    temperature: *temp\n"
+        "  unsafe:\n"
+        "    hook: !!python/name:os.system\n"  # the safe loader refuses to construct this one
+    )
+    assert JustYaml.yaml_section_keys(config) == ["agent_profiles"]
+    assert JustYaml.yaml_section_keys(config, "agent_profiles") == ["assistant", "critic", "unsafe"]
+    assert JustYaml.load_yaml_section(config, "agent_profiles", "critic") == {"temperature": 0.5}
+    assert JustYaml.read_yaml_data_safe(config, "assistant", "agent_profiles") == {"temperature": 0.5}
+    assert JustYaml.read_yaml_data_safe(config, "missing", "agent_profiles") is None
+    with pytest.raises(KeyError):
+        JustYaml.load_yaml_section(config, "agent_profiles", "missing")
+
+def test_yaml_merge_keys_leave_the_cached_nodes_intact(tmp_path):
+    from just_agents.just_serialization import JustYaml
+
+    config = tmp_path / "agents.yaml"
+    config.write_text(
+        "shared: &base\n"
+        "  inherited_agent:\n"
+        "    model: x\n"
+        "defaults: &defaults\n"
+        "  temperature: 0.5\n"
+        "agent_profiles:\n"
+        "  <<: *base\n"
+        "  own_agent:\n"
+        "    <<: *defaults\n"
+        "    model: y\n"
+    )
+    for _ in range(2):  # the first construction must not change what later lookups see
+        assert JustYaml.yaml_section_keys(config, "agent_profiles") == ["inherited_agent", "own_agent"]
+        assert JustYaml.read_yaml_data_safe(config, "inherited_agent", "agent_profiles") == {"model": "x"}
+        assert JustYaml.read_yaml_data_safe(config, "own_agent", "agent_profiles") == {"temperature": 0.5, "model": "y"}
+        assert JustYaml.load_yaml_file(config)["agent_profiles"]["own_agent"] == {"temperature": 0.5, "model": "y"}
+    assert JustYaml.load_yaml_file(config)["defaults"] == {"temperature": 0.5}
+
+def test_auto_load_can_reuse_live_instances(tmp_path):
+    config_path = tmp_path / "profiles.yaml"
+    JustAgentProfile(tools=[krex_pex_fex], config_path=config_path).save_to_yaml("TestProfileB")
+
+    shared = JustAgentProfile.auto_load("TestProfileB", file_path=config_path, reuse_live=True)
+    assert JustAgentProfile.auto_load("TestProfileB", file_path=config_path, reuse_live=True) is shared
+    assert JustAgentProfile.auto_load("TestProfileB", file_path=config_path) is not shared
+
+    JustAgentProfile(tools=[krex_pex_fex], description="Changed", config_path=config_path).save_to_yaml("TestProfileB")
+    changed = JustAgentProfile.auto_load("TestProfileB", file_path=config_path, reuse_live=True)
+    assert changed is not shared and changed.description == "Changed"
+
+
+def test_auto_load_reuses_only_instances_of_the_same_file_and_class(tmp_path):
+    first_path, second_path = tmp_path / "first.yaml", tmp_path / "second.yaml"
+    for config_path in (first_path, second_path):
+        JustAgentProfile(tools=[krex_pex_fex], config_path=config_path).save_to_yaml("TestProfileB")
+
+    first = JustAgentProfile.auto_load("TestProfileB", file_path=first_path, reuse_live=True)
+    second = JustAgentProfile.auto_load("TestProfileB", file_path=second_path, reuse_live=True)
+    assert second is not first
+    assert second.config_path == second_path  # so save_to_yaml writes back to the file it came from
+
+    class DerivedProfile(JustAgentProfile):
+        pass
+
+    assert DerivedProfile.auto_load("TestProfileB", file_path=first_path, reuse_live=True) is not first
+
+def test_auto_load_falls_back_for_sections_it_cannot_key(tmp_path):
+    config_path = tmp_path / "profiles.yaml"
+    config_path.write_text(
+        "TestProfileB:\n"
+        "  class_qualname: just_agents.just_profile.JustAgentProfile\n"
+        "  tags: !!set {alpha: null}\n"
+        "  blob: !!binary aGVsbG8=\n"
+    )
+    first = JustAgentProfile.auto_load("TestProfileB", file_path=config_path, reuse_live=True)
+    second = JustAgentProfile.auto_load("TestProfileB", file_path=config_path, reuse_live=True)
+    assert isinstance(first, JustAgentProfile) and first.tags == {"alpha"}
+    assert second is not first  # loaded without reuse
@@ -245,3 +245,25 @@ def test_stream_tool_grok():
     validate_tool_call(agent_call, LLAMA3_2_VISION, False)
 
 
+
+def test_text_chunks_share_creation_time():
+    from just_agents.interfaces.protocol_adapter import IProtocolAdapter
+
+    chunks = list(IProtocolAdapter.create_streaming_chunks_from_text("Hello", "test-model", created_timestamp=1700000000))
+    assert len(chunks) == 3
+    assert {chunk["created"] for chunk in chunks} == {1700000000}
+    assert len({chunk["id"] for chunk in chunks}) == 1
+
+    chunks = list(IProtocolAdapter.create_streaming_chunks_from_text("Hello", "test-model"))
+    assert len({chunk["created"] for chunk in chunks}) == 1
+    content = IProtocolAdapter.content_from_stream(
+        IProtocolAdapter.create_streaming_chunks_from_text("Hello", "test-model", format_as_sse=True)
+    )
+    assert content == "Hello"
+
+def test_sse_wrap_and_parse_roundtrip():
+    payload = {"choices": [{"delta": {"content": "Grüße"}}], 1: None}
+    message = SSE.sse_wrap(payload, event="chunk")
+    assert message == 'event: chunk\ndata: {"choices":[{"delta":{"content":"Grüße"}}],"1":null}\n\n'
+    assert SSE.sse_parse(message) == {"event": "chunk", "data": {"choices": [{"delta": {"content": "Grüße"}}], "1": None}}
+    assert SSE.sse_parse(SSE.sse_wrap("[DONE]"))["data"] == "[DONE]"
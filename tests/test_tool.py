@@ -0,0 +1,154 @@
+import pytest
+
+from just_agents.just_tool import JustTool, _LLM_DICT_CACHE
+
+
+def multiply(a: int, b: int = 2) -> int:
+    """
+    Multiplies two numbers
+
+    Args:
+        a: The first factor
+        b: The second factor
+    """
+    return a * b
+
+
+def test_llm_dict_is_cached_and_copied():
+    first = JustTool.function_to_llm_dict(multiply)
+    assert multiply in _LLM_DICT_CACHE
+    first["parameters"]["properties"]["a"]["description"] = "mutated"
+
+    second = JustTool.function_to_llm_dict(multiply)
+    assert second["parameters"]["properties"]["a"]["description"] == "The first factor"
+    assert second["parameters"]["required"] == ["a"]
+
+
+def test_llm_dict_cache_tracks_function_changes():
+    def local_tool(x: str) -> str:
+        """Echoes the input"""
+        return x
+
+    assert JustTool.function_to_llm_dict(local_tool)["description"] == "Echoes the input"
+    local_tool.__doc__ = "Repeats the input"
+    assert JustTool.function_to_llm_dict(local_tool)["description"] == "Repeats the input"
+
+
+def test_tool_from_callable():
+    tool = JustTool.from_callable(multiply)
+    assert tool.name == "multiply"
+    assert tool.get_litellm_description()["parameters"]["properties"]["b"]["type"] == "integer"
+    assert tool(3, b=4) == 12
+
+
+def test_tool_call_events():
+    tool = JustTool.from_callable(multiply)
+    events = []
+    tool.subscribe(lambda event_name, *args, **kwargs: events.append(event_name))
+
+    assert tool(2, 5) == 10
+    assert events == [f"multiply.{id(tool)}.execute", f"multiply.{id(tool)}.result"]
+
+
+def test_tool_call_limit():
+    tool = JustTool.from_callable(multiply)
+    tool.max_calls_per_query = 1
+    errors = []
+    tool.subscribe_to_error(lambda event_name, *args, **kwargs: errors.append(kwargs["error"]))
+
+    assert tool(1) == 2
+    with pytest.raises(RuntimeError):
+        tool(1)
+    assert tool.remaining_calls == 0
+    assert errors and isinstance(errors[0], RuntimeError)
+    assert tool.reset()(1) == 2
+
+
+def test_tool_event_names_are_interned():
+    tool = JustTool.from_callable(multiply)
+    callback = lambda event_name, *args, **kwargs: None
+    tool.subscribe_to_result(callback)
+
+    invoker = tool.get_callable()
+    bus_keys = [key for key in invoker.bus._subscribers if key == invoker.ev_res]
+    assert bus_keys and bus_keys[0] is invoker.ev_res
+    assert tool.unsubscribe(callback, "result")
+
+
+def test_litellm_description_follows_the_tool():
+    tool = JustTool.from_callable(multiply)
+    first = tool.get_litellm_description()
+    first["name"] = "mutated"
+    first["parameters"]["properties"].clear()  # e.g. a provider transform rewriting the schema
+    second = tool.get_litellm_description()
+    assert second == {"name": "multiply", "description": "Multiplies two numbers", "parameters": tool.parameters}
+    assert second["parameters"]["properties"]
+
+    tool.parameters["properties"]["b"]["description"] = "The multiplier"  # edited in place
+    assert tool.get_litellm_description()["parameters"]["properties"]["b"]["description"] == "The multiplier"
+
+    tool.description = "Multiplies numbers"
+    assert tool.get_litellm_description()["description"] == "Multiplies numbers"
+    assert tool.refresh().get_litellm_description()["description"] == "Multiplies two numbers"
+
+
+def test_agent_dispatches_tool_calls_by_name():
+    from just_agents.base_agent import BaseAgent
+    from just_agents.protocols.litellm_protocol import LiteLLMFunctionCall
+
+    agent = BaseAgent(llm_options={"model": "gpt-4o-mini"}, tools=[multiply])
+    messages = agent._process_function_calls([
+        LiteLLMFunctionCall(id="call_1", function={"name": "multiply", "arguments": '{"a": 3}'}),
+        LiteLLMFunctionCall(id="call_2", function={"name": "missing", "arguments": "{}"}),
+    ])
+    assert messages[0]["content"] == "6"
+    assert messages[1]["content"].startswith("Error occurred during call")
+
+
+def test_refresh_keeps_the_wrapper():
+    tool = JustTool.from_callable(multiply)
+    invoker = tool.get_callable()
+    assert tool.refresh().get_callable() is invoker
+    assert tool.get_callable(refresh=True) is invoker
+
+    copied = tool.model_copy()
+    assert copied.refresh().get_callable() is not invoker  # a copy publishes under its own event names
+    assert copied.get_callable().tool is copied
+
+
+def test_saved_schema_skips_introspection(monkeypatch):
+    saved = JustTool.from_callable(multiply).model_dump(exclude_none=True)
+    assert saved["schema_fingerprint"]
+
+    def no_introspection(input_function):
+        raise AssertionError("the saved description should have been reused")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(JustTool, "function_to_llm_dict", staticmethod(no_introspection))
+        loaded = JustTool(**saved)
+        assert loaded.refresh().get_litellm_description()["parameters"] == saved["parameters"]
+        assert loaded(3) == 6
+
+    stale = JustTool(**{**saved, "schema_fingerprint": "outdated", "description": "Old description"})
+    assert stale.description == "Multiplies two numbers"  # the function changed since it was saved
+    assert stale.schema_fingerprint == saved["schema_fingerprint"]
+
+
+def test_extractor_changes_rebuild_saved_schemas(monkeypatch):
+    import just_agents.just_tool as just_tool
+
+    saved = JustTool.from_callable(multiply).model_dump(exclude_none=True)
+    monkeypatch.setattr(just_tool, "_SCHEMA_EXTRACTOR_VERSION", just_tool._SCHEMA_EXTRACTOR_VERSION + 1)
+    rebuilt = JustTool(**{**saved, "description": "Old description"})
+    assert rebuilt.description == "Multiplies two numbers"
+    assert rebuilt.schema_fingerprint != saved["schema_fingerprint"]
+
+
+def test_fingerprint_is_not_sent_to_the_llm():
+    from just_agents.just_tool import JustPromptTool
+
+    saved = JustTool.from_callable(multiply).model_dump(exclude_none=True)
+    prompt_tool = JustPromptTool(**saved, call_arguments={"a": 3})
+    assert prompt_tool.schema_fingerprint
+    assert "schema_fingerprint" not in prompt_tool.get_litellm_description()
+    assert "schema_fingerprint" not in JustTool(**saved).get_litellm_description()
@@ -1,6 +1,8 @@
 import json
 import glob
 import os
+import subprocess
+import sys
 import pytest
 from pathlib import Path
 from dotenv import load_dotenv
@@ -22,6 +24,17 @@ MODELS_DIR = os.path.join(TESTS_DIR, "models.d")  # Path to models.d inside test
 def load_env():
     load_dotenv(override=True)
 
+@pytest.fixture(autouse=True)
+def restore_llm_client():
+    """Apps started here and tests set the process-wide litellm client session, close any left over and put the previous one back."""
+    import litellm
+
+    previous = litellm.client_session
+    yield
+    if litellm.client_session is not previous:
+        litellm.client_session.close()
+        litellm.client_session = previous
+
 
 def test_web_agent_profile(load_env, tmp_path):
 
@@ -199,4 +212,139 @@ def test_validate_chat_ui_config(load_env):
     )
     assert all(isinstance(agent, WebAgent) for agent in api.agents.values())
     assert all(isinstance(agent, ChatUIAgent) for agent in api.agents.values())
-    assert isinstance(api, ChatUIAgentRestAPI)
\ No newline at end of file
+    assert isinstance(api, ChatUIAgentRestAPI)
+
+def test_run_agent_cli_imports_web_stack_lazily():
+    code = (
+        "import sys, just_agents.web.run_agent; "
+        "sys.exit(any(m in sys.modules for m in ('litellm', 'fastapi', 'uvicorn', 'typer')))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+def test_api_compresses_json_responses(load_env):
+    from fastapi.testclient import TestClient
+
+    api = validate_agent_config(
+        config=Path(TESTS_DIR) / "profiles" / "agent_profiles.yaml",
+        parent_section="agent_profiles",
+        debug=True
+    )
+    response = TestClient(api).get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+    assert response.json()["info"]["title"] == "Just-Agent endpoint"
+
+def test_app_factory_builds_api_from_env(load_env, monkeypatch):
+    from just_agents.web.run_agent import _app_factory, _api_class_path
+
+    monkeypatch.setenv("AGENT_API_CLASS", _api_class_path(ChatUIAgentRestAPI))
+    monkeypatch.setenv("AGENT_CONFIG_PATH", str(Path(TESTS_DIR) / "profiles" / "agent_profiles.yaml"))
+    monkeypatch.setenv("AGENT_PARENT_SECTION", "agent_profiles")
+    monkeypatch.setenv("AGENT_TITLE", "Worker endpoint")
+    monkeypatch.delenv("AGENT_SECTION", raising=False)
+    api = _app_factory()
+    assert isinstance(api, ChatUIAgentRestAPI)
+    assert api.title == "Worker endpoint"
+    assert api.agents
+
+    class LocalAPI(ChatUIAgentRestAPI):
+        pass
+
+    with pytest.raises(ValueError):
+        _api_class_path(LocalAPI)
+
+def test_web_agents_single_section(load_env):
+    config_path = Path(TESTS_DIR) / "profiles" / "agent_profiles.yaml"
+    agents = WebAgent.from_yaml_dict(yaml_path=config_path, parent_section="agent_profiles", section="web_agent")
+    assert list(agents) == ["web_agent"]
+    assert WebAgent.from_yaml_dict(yaml_path=config_path, parent_section="agent_profiles", section="missing") == {}
+
+def test_validated_api_is_reused_until_config_changes(load_env, tmp_path, monkeypatch):
+    config_path = tmp_path / "agent_profiles.yaml"
+    config_path.write_bytes((Path(TESTS_DIR) / "profiles" / "agent_profiles.yaml").read_bytes())
+
+    import uvicorn
+    from just_agents.web.run_agent import run_agent_server
+
+    assert validate_agent_config(config=config_path, parent_section="agent_profiles") is not \
+        validate_agent_config(config=config_path, parent_section="agent_profiles")  # no reuse unless asked for
+
+    api = validate_agent_config(config=config_path, parent_section="agent_profiles", debug=True, reuse=True)
+    assert validate_agent_config(config=config_path, parent_section="agent_profiles", debug=True, reuse=True) is api
+    assert validate_agent_config(config=config_path, parent_section="agent_profiles", debug=False, reuse=True) is not api
+
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    api = validate_agent_config(config=config_path, parent_section="agent_profiles", debug=True, reuse=True)
+    assert validate_agent_config(config=config_path, parent_section="agent_profiles", debug=True, reuse=True) is api
+
+    served = []
+    monkeypatch.setattr(uvicorn, "run", lambda app, **options: served.append(app))
+    run_agent_server(config=config_path, parent_section="agent_profiles", debug=True)
+    assert served == [api]  # the validated API is handed to the server
+    assert validate_agent_config(config=config_path, parent_section="agent_profiles", debug=True, reuse=True) is not api
+
+def test_remote_config_is_served_stale_while_revalidating(load_env, tmp_path):
+    import threading
+    fsspec = pytest.importorskip("fsspec")
+    from just_agents.web.remote_config import REFRESH_THREAD_NAME, fetch_remote_config, is_remote_config
+
+    url = "memory://just-agents-tests/agent_profiles.yaml"
+    profiles = (Path(TESTS_DIR) / "profiles" / "agent_profiles.yaml").read_bytes()
+    with fsspec.open(url, "wb") as remote:
+        remote.write(profiles)
+    assert is_remote_config(url)
+    assert not is_remote_config("agent_profiles.yaml") and not is_remote_config(Path("/app/agent_profiles.yaml"))
+    assert not is_remote_config("configs:prod.yaml") and not is_remote_config("C:\\agents\\agent_profiles.yaml")
+
+    local = fetch_remote_config(url, cache_dir=tmp_path)
+    assert local.parent == tmp_path and local.read_bytes() == profiles
+
+    with fsspec.open(url, "wb") as remote:
+        remote.write(b"agent_profiles: {}\n")
+    assert fetch_remote_config(url, cache_dir=tmp_path) == local
+    for thread in threading.enumerate():
+        if thread.name == REFRESH_THREAD_NAME:
+            thread.join()
+    assert local.read_bytes() == b"agent_profiles: {}\n"
+    fsspec.filesystem("memory").rm(url)
+
+def test_agents_share_one_llm_http_client(load_env):
+    import httpx
+    import litellm
+    from fastapi.testclient import TestClient
+    from just_agents.web.rest_api import AgentRestAPI
+
+    config_path = Path(TESTS_DIR) / "profiles" / "agent_profiles.yaml"
+    first = AgentRestAPI(agent_config=config_path, agent_parent_section="agent_profiles", debug=True)
+    second = AgentRestAPI(agent_config=config_path, agent_parent_section="agent_profiles", debug=False)
+    assert litellm.client_session is None  # installed by running apps only
+    with TestClient(second):
+        with TestClient(first):
+            session = litellm.client_session
+            assert isinstance(session, httpx.Client)
+        assert litellm.client_session is session and not session.is_closed  # the second app still uses it
+    assert litellm.client_session is None
+    assert session.is_closed
+
+
+def test_llm_http_client_leaves_application_sessions_alone(load_env):
+    import httpx
+    import litellm
+    from fastapi.testclient import TestClient
+    from just_agents.web.rest_api import AgentRestAPI
+
+    config_path = Path(TESTS_DIR) / "profiles" / "agent_profiles.yaml"
+    own_session = litellm.client_session = httpx.Client()
+    with TestClient(AgentRestAPI(agent_config=config_path, agent_parent_section="agent_profiles")):
+        assert litellm.client_session is own_session
+    assert litellm.client_session is own_session and not own_session.is_closed
+
+
+def test_llm_http_client_follows_litellm_ssl_settings(monkeypatch):
+    import litellm
+    from just_agents.web.rest_api import _llm_client_ssl
+
+    monkeypatch.setattr(litellm, "ssl_verify", False)
+    monkeypatch.setenv("SSL_CERTIFICATE", "/path/to/client.pem")
+    assert _llm_client_ssl() == {"verify": False, "cert": "/path/to/client.pem"}
@@ -0,0 +1,73 @@
+import hashlib
+import os
+import threading
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "just_agents"
+REFRESH_THREAD_NAME = "just-agents-config-refresh"
+REMOTE_CONFIG_SCHEMES = frozenset({
+    "http", "https", "ftp", "sftp", "ssh", "smb", "webdav", "webhdfs", "hdfs",
+    "s3", "s3a", "gs", "gcs", "az", "abfs", "abfss", "adl", "oci", "oss", "dbfs", "hf", "github",
+    "memory",  # fsspec's in-process filesystem, handy for tests
+})
+"""URL schemes treated as remote configs, anything else (e.g. 'configs:prod.yaml') is a local path."""
+
+def is_remote_config(config: Optional[Union[Path, str]]) -> bool:
+    """
+    Check whether a config location is a URL (s3://, gs://, https://, ...) rather than a local file.
+
+    Args:
+        config: Path or string pointing at the agent configuration
+
+    Returns:
+        bool: True for URLs with one of the REMOTE_CONFIG_SCHEMES
+    """
+    if config is None or isinstance(config, Path):
+        return False
+    return urlparse(config).scheme.lower() in REMOTE_CONFIG_SCHEMES
+
+def _download(url: str, target: Path) -> None:
+    import fsspec  # checked by fetch_remote_config, imported here to keep local-only startups free of it
+    with fsspec.open(url, "rb") as remote:
+        data = remote.read()
+    partial = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.part")
+    partial.write_bytes(data)
+    os.replace(partial, target)  # readers never see a half-written config
+
+def _refresh(url: str, target: Path) -> None:
+    try:
+        _download(url, target)
+    except Exception as e:
+        from eliot import log_message
+        # keep serving the stale copy, the next start tries again
+        log_message(message_type="remote_config.refresh_failed", url=url, path=str(target), error=str(e))
+
+def fetch_remote_config(url: str, cache_dir: Optional[Path] = None, refresh: bool = True) -> Path:
+    """
+    Return a local copy of a remote agent configuration, stale-while-revalidate style.
+
+    Only the first fetch of a URL blocks. Afterwards the cached copy is returned right away
+    and, if refresh is set, updated in place by a background thread.
+
+    Args:
+        url: Any URL fsspec can open, e.g. s3://bucket/agent_profiles.yaml
+        cache_dir: Directory for the cached copies, defaults to ~/.cache/just_agents
+        refresh: Refresh an existing cached copy in the background
+
+    Returns:
+        Path: The local file to load the configuration from
+    """
+    if find_spec("fsspec") is None:
+        raise ImportError("Loading agent configs from URLs requires fsspec, install it with 'pip install just-agents-web[remote]'")
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    suffix = Path(urlparse(url).path).suffix or ".yaml"
+    target = cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()[:16]}{suffix}"
+    if not target.exists():
+        _download(url, target)
+    elif refresh:
+        threading.Thread(target=_refresh, args=(url, target), name=REFRESH_THREAD_NAME, daemon=True).start()
+    return target
@@ -1,8 +1,11 @@
 import base64
 import hashlib
 import mimetypes
+import os
+import threading
 import time
 
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union, Type, ClassVar
 
@@ -16,12 +19,79 @@ from just_agents.web.models import (
      ChatCompletionRequest, ChatCompletionResponse, ChatCompletionUsage, ErrorResponse
 )
 from dotenv import load_dotenv
+import httpx
+import litellm
 
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, JSONResponse, ORJSONResponse, Response
 from eliot import start_task
 
+try:
+    # Starlette versions that know this list leave SSE streams uncompressed, older ones would buffer them
+    from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
+    _GZIP_SKIPS_EVENT_STREAMS = "text/event-stream" in DEFAULT_EXCLUDED_CONTENT_TYPES
+except ImportError:
+    _GZIP_SKIPS_EVENT_STREAMS = False
+
+# orjson-backed bodies are faster to render; recent FastAPI deprecates ORJSONResponse
+# because it serializes typed responses to bytes through pydantic with the default class
+DEFAULT_RESPONSE_CLASS: Type[Response] = JSONResponse if getattr(ORJSONResponse, "__deprecated__", None) else ORJSONResponse
+
+GZIP_MINIMUM_SIZE = 500  # bytes, smaller bodies are not worth compressing
+GZIP_COMPRESS_LEVEL = 5  # most of the ratio of level 9 at a fraction of the CPU
+
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+LLM_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)  # completions may stream for minutes, connecting should not
+
+_llm_client_lock = threading.Lock()
+_llm_client: Optional[httpx.Client] = None
+_llm_client_users = 0
+
+def _llm_client_ssl() -> Dict[str, Any]:
+    """The certificate settings litellm would give its own clients (ssl_verify, CA bundle, client certificate)."""
+    try:
+        from litellm.llms.custom_httpx.http_handler import get_ssl_configuration
+        verify = get_ssl_configuration()
+    except ImportError:  # litellm versions before the unified SSL configuration
+        verify = litellm.ssl_verify
+    return {"verify": verify, "cert": os.getenv("SSL_CERTIFICATE", getattr(litellm, "ssl_certificate", None))}
+
+def _acquire_llm_client() -> bool:
+    """
+    Install the shared LLM client as litellm.client_session for one more running app.
+    Returns False if the embedding application set its own client session, which is left alone.
+    """
+    global _llm_client, _llm_client_users
+    with _llm_client_lock:
+        if _llm_client is None:
+            if litellm.client_session is not None:
+                return False
+            _llm_client = httpx.Client(
+                http2=find_spec("h2") is not None,  # multiplexes concurrent calls to one upstream when available
+                limits=LLM_HTTP_LIMITS,
+                timeout=LLM_HTTP_TIMEOUT,
+                **_llm_client_ssl()
+            )
+            litellm.client_session = _llm_client
+        _llm_client_users += 1
+        return True
+
+def _release_llm_client() -> None:
+    """Drop one running app from the shared LLM client, the last one to shut down closes and unsets it."""
+    global _llm_client, _llm_client_users
+    with _llm_client_lock:
+        if _llm_client is None:
+            return
+        _llm_client_users -= 1
+        if _llm_client_users > 0:
+            return
+        if litellm.client_session is _llm_client:  # someone may have replaced it since
+            litellm.client_session = None
+        _llm_client.close()
+        _llm_client = None
+
 
 
 class AgentRestAPI(FastAPI):
@@ -52,6 +122,7 @@ class AgentRestAPI(FastAPI):
         agents: Optional[Dict[str, BaseAgent]] = None, # We can set up agents explicitly here instead of loading them from yaml
         use_proxy:Optional[bool] = None,
         proxy_address:Optional[str] = None,
+        default_response_class: Type[Response] = DEFAULT_RESPONSE_CLASS,
 
     ) -> None:
         """Initialize the AgentRestAPI with FastAPI parameters.
@@ -69,6 +140,7 @@ class AgentRestAPI(FastAPI):
             terms_of_service: URL to the terms of service
             contact: Contact information in the OpenAPI schema
             license_info: License information in the OpenAPI schema
+            default_response_class: Response class used for JSON bodies, orjson-backed where supported
         """
         super().__init__(
             debug=debug,
@@ -82,7 +154,8 @@ class AgentRestAPI(FastAPI):
             redoc_url=redoc_url,
             terms_of_service=terms_of_service,
             contact=contact,
-            license_info=license_info
+            license_info=license_info,
+            default_response_class=default_response_class
         )
         load_dotenv(override=True)
 
@@ -96,6 +169,7 @@ class AgentRestAPI(FastAPI):
 
         self.agents = {} if agents is None else agents # Dictionary to store multiple agents
         self._agent_related_config(agent_config, agent_section, agent_parent_section, self.AGENT_CLASS)
+        self._llm_client_config()
         self._routes_config()
 
     def _initialize_config(self):
@@ -103,6 +177,26 @@ class AgentRestAPI(FastAPI):
         if Path(self.config.env_keys_path).resolve().absolute().exists():
             load_dotenv(self.config.env_keys_path, override=True)
 
+    def _llm_client_config(self) -> None:
+        """
+        Send the LLM calls of all agents in this process through one shared HTTP client,
+        so agents talking to the same provider reuse its connection pool and TLS sessions.
+        The client is shared by every running app and closed when the last of them shuts down.
+        A client session already set by the embedding application is left alone.
+        """
+        self._uses_llm_client = False
+
+        def acquire() -> None:
+            self._uses_llm_client = _acquire_llm_client()
+
+        def release() -> None:
+            if self._uses_llm_client:
+                self._uses_llm_client = False
+                _release_llm_client()
+
+        self.router.on_startup.append(acquire)
+        self.router.on_shutdown.append(release)
+
     def _agent_related_config(
             self, 
             agent_config: Path | str, 
@@ -204,6 +298,13 @@ class AgentRestAPI(FastAPI):
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        # Compress JSON responses, streamed completions are sent as is
+        if _GZIP_SKIPS_EVENT_STREAMS:
+            self.add_middleware(
+                GZipMiddleware,
+                minimum_size=GZIP_MINIMUM_SIZE,
+                compresslevel=GZIP_COMPRESS_LEVEL,
+            )
         # Register routes
         self.get("/")(self.default)
         self.get("/v1/models", description="List available models")(self.list_models)
@@ -1,35 +1,136 @@
+import os
+from contextlib import nullcontext
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Type
+from typing import Any, Callable, Optional, Type, Union, TYPE_CHECKING
 from just_agents.web.config import ChatUIAgentConfig
-from just_agents.web.rest_api import AgentRestAPI
-from just_agents.web.chat_ui_rest_api import ChatUIAgentRestAPI
-import uvicorn
-import typer
-from eliot import start_action, start_task
+from just_agents.web.remote_config import fetch_remote_config, is_remote_config
+import click
 
-env_config = ChatUIAgentConfig()
-app = typer.Typer()
+# The web stack (FastAPI, litellm, uvicorn, eliot) is imported by the commands that use it,
+# so that --help and argument errors do not pay its import cost.
+if TYPE_CHECKING:
+    from just_agents.web.rest_api import AgentRestAPI
+
+@lru_cache(maxsize=1)
+def _env() -> ChatUIAgentConfig:
+    """Settings from the environment, read once on first use instead of at import time."""
+    return ChatUIAgentConfig()
+
+def _env_default(name: str) -> Callable[[], Any]:
+    """Click default for an option that falls back to an environment setting, evaluated when the command runs."""
+    return lambda: getattr(_env(), name)
+
+def _default_api_class() -> Type['AgentRestAPI']:
+    from just_agents.web.rest_api import AgentRestAPI
+    return AgentRestAPI
+
+def _chat_ui_api_class() -> Type['AgentRestAPI']:
+    from just_agents.web.chat_ui_rest_api import ChatUIAgentRestAPI
+    return ChatUIAgentRestAPI
+
+def _api_class_path(api_class: Type['AgentRestAPI']) -> str:
+    """Return the 'module:QualName' import path worker processes use to find the API class."""
+    if "<locals>" in api_class.__qualname__:
+        raise ValueError(
+            f"{api_class.__qualname__} is defined inside a function and cannot be imported by worker processes, "
+            "run it with workers=1 or move the class to module level."
+        )
+    return f"{api_class.__module__}:{api_class.__qualname__}"
+
+def _app_factory() -> 'AgentRestAPI':
+    """
+    Build the API inside a uvicorn worker process.
+
+    The settings are passed through the same environment variables that ChatUIAgentConfig reads,
+    which run_agent_server exports before handing the import string to uvicorn.
+    """
+    worker_config = ChatUIAgentConfig()
+    module_name, _, qualname = os.environ["AGENT_API_CLASS"].partition(":")
+    api_class = import_module(module_name)
+    for name in qualname.split("."):
+        api_class = getattr(api_class, name)
+    return api_class(
+        agent_config=worker_config.agent_config_path,
+        agent_section=worker_config.section,
+        agent_parent_section=worker_config.parent_section,
+        debug=worker_config.debug,
+        title=worker_config.title
+    )
+
+def _resolve_config(config: Optional[Union[Path, str]]) -> Optional[Path]:
+    """Turn a config argument into a local path, remote URLs are served from their cached copy."""
+    if config is None:
+        return None
+    if is_remote_config(config):
+        return fetch_remote_config(config)
+    return Path(config)
+
+@lru_cache(maxsize=4)
+def _build_api(
+    api_class: Type['AgentRestAPI'],
+    config_str: str,
+    config_mtime_ns: Optional[int],
+    title: str,
+    section: Optional[str],
+    parent_section: Optional[str],
+    debug: bool,
+) -> 'AgentRestAPI':
+    """Build an API once per configuration, the file's modification time makes an edited config build a new one."""
+    return api_class(
+        agent_config=config_str,
+        agent_section=section,
+        agent_parent_section=parent_section,
+        debug=debug,
+        title=title
+    )
+
+def _get_api(
+    api_class: Type['AgentRestAPI'],
+    config: Optional[Path],
+    title: str,
+    section: Optional[str],
+    parent_section: Optional[str],
+    debug: bool,
+    reuse: bool = True,
+) -> 'AgentRestAPI':
+    """
+    Return the API for a configuration.
+    With reuse, the API kept by an earlier reusing call with the same configuration in this process is returned.
+    """
+    config_path = Path(config if config is not None else _env().agent_config_path).resolve()
+    config_mtime_ns = config_path.stat().st_mtime_ns if config_path.exists() else None
+    build = _build_api if reuse else _build_api.__wrapped__
+    return build(api_class, str(config_path), config_mtime_ns, title, section, parent_section, debug)
 
 def validate_agent_config(
-    config: Optional[Path] = None, 
+    config: Optional[Union[Path, str]] = None, 
     section: Optional[str] = None, 
     parent_section: Optional[str] = None,
-    api_class: Type[AgentRestAPI] = AgentRestAPI,
+    api_class: Optional[Type['AgentRestAPI']] = None,
     debug: bool = True,
-) -> AgentRestAPI:
+    reuse: bool = False,
+) -> 'AgentRestAPI':
     """
     Validate the agent configuration and return an AgentRestAPI instance.
     
     Args:
-        config: Path to the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory
+        config: Path or URL (s3://, https://, ...) of the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory
         section: Optional section name in the config file
         parent_section: Optional parent section name in the config file
         debug: Debug mode
-        api_class: AgentRestAPI or ChatUIAgentRestAPI
+        api_class: AgentRestAPI or ChatUIAgentRestAPI, defaults to AgentRestAPI
+        reuse: Keep the API for a later run_agent_server call with the same configuration in this process,
+            which then serves it instead of building it again. Repeated reusing calls share the instance.
         
     Returns:
         AgentRestAPI: Validated API instance
     """
+    if api_class is None:
+        api_class = _default_api_class()
+    config = _resolve_config(config)
     if config is None:
         config = Path("agent_profiles.yaml")
     
@@ -39,16 +140,10 @@ def validate_agent_config(
             "or ensure 'agent_profiles.yaml' exists in the current directory."
         )
     
-    return api_class(
-        agent_config=config,
-        title="Just-Agent endpoint",
-        agent_section=section,
-        agent_parent_section=parent_section,
-        debug=debug
-    )
+    return _get_api(api_class, config, "Just-Agent endpoint", section, parent_section, debug, reuse=reuse)
 
 def run_agent_server(
-    config: Optional[Path] = None,
+    config: Optional[Union[Path, str]] = None,
     host: str = "0.0.0.0",
     port: int = 8088,
     workers: int = 1,
@@ -56,13 +151,13 @@ def run_agent_server(
     section: Optional[str] = None,
     parent_section: Optional[str] = None,
     debug: bool = True,
-    api_class: Type[AgentRestAPI] = AgentRestAPI
+    api_class: Optional[Type['AgentRestAPI']] = None
 ) -> None:
     """
     Run the FastAPI server with the given configuration.
     
     Args:
-        config: Path to the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory
+        config: Path or URL (s3://, https://, ...) of the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory
         host: Host to bind the server to
         port: Port to run the server on
         workers: Number of worker processes
@@ -70,44 +165,93 @@ def run_agent_server(
         section: Optional section name in the config file
         parent_section: Optional parent section name in the config file
         debug: Debug mode
-        api_class: AgentRestAPI or ChatUIAgentRestAPI
+        api_class: AgentRestAPI or ChatUIAgentRestAPI, defaults to AgentRestAPI
 
     """
-    #to_nice_stdout()
-
-    # Initialize the API class with the updated configuration
-    api = api_class(
-        agent_config=config,
-        agent_section=section,
-        agent_parent_section=parent_section,
-        debug=debug,
-        title=title
-    )
-    
-    uvicorn.run(
-        api,
+    import uvicorn
+    from uvicorn.config import LOGGING_CONFIG
+    # remote configs are fetched before forking, so all workers read the same local copy
+    config = _resolve_config(config if config is not None else _env().agent_config_path)
+    if api_class is None:
+        api_class = _default_api_class()
+    server_options = dict(
         host=host,
         port=port,
-        workers=workers
+        loop="uvloop" if find_spec("uvloop") else "auto",  # uvloop is not available on Windows
+        http="httptools" if find_spec("httptools") else "auto",
+        log_level="info" if debug else "warning",
+        access_log=debug,  # per-request access logging costs throughput, keep it for debugging only
+        log_config=LOGGING_CONFIG if debug else None  # without debug uvicorn leaves logging to the root logger
     )
 
-@app.command()
-def run_server_command(
-    config: Optional[Path] = typer.Argument(
-        None,
-        help="Path to the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory"
-    ),
-    host: str = typer.Option(env_config.host, help="Host to bind the server to"),
-    port: int = typer.Option(env_config.port, help="Port to run the server on"),
-    workers: int = typer.Option(env_config.workers, help="Number of worker processes"),
-    title: str = typer.Option(env_config.title, help="Title for the API endpoint"),
-    section: Optional[str] = typer.Option(env_config.section, help="Optional section name in the config file"),
-    parent_section: Optional[str] = typer.Option(env_config.parent_section, help="Optional parent section name in the config file"),
-    debug: bool = typer.Option(env_config.debug, help="Debug mode"),
+    if workers > 1:
+        # uvicorn only forks workers for an import string, an app instance is silently served by one process
+        worker_env = {
+            "AGENT_API_CLASS": _api_class_path(api_class),
+            "AGENT_CONFIG_PATH": str(config if config is not None else _env().agent_config_path),
+            "AGENT_SECTION": section,
+            "AGENT_PARENT_SECTION": parent_section,
+            "AGENT_DEBUG": str(debug).lower(),
+            "AGENT_TITLE": title,
+        }
+        for key, value in worker_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        uvicorn.run("just_agents.web.run_agent:_app_factory", factory=True, workers=workers, **server_options)
+        return
+
+    # Serves the API kept by validate_agent_config(reuse=True) if the same configuration was validated earlier
+    api = _get_api(api_class, config, title, section, parent_section, debug)
+    try:
+        uvicorn.run(api, **server_options)
+    finally:
+        _build_api.cache_clear()  # the hand-off is over, later validations and runs build fresh APIs
+
+def _config_options(command: Callable) -> Callable:
+    """Arguments shared by all commands: the config location and where to find the agents in it."""
+    command = click.option("--debug/--no-debug", default=_env_default("debug"), help="Debug mode")(command)
+    command = click.option("--parent-section", default=_env_default("parent_section"), help="Optional parent section name in the config file")(command)
+    command = click.option("--section", default=_env_default("section"), help="Optional section name in the config file")(command)
+    return click.argument("config", required=False)(command)
+
+def _server_options(command: Callable) -> Callable:
+    """Options of the commands that start a server."""
+    command = click.option("--title", type=str, default=_env_default("title"), help="Title for the API endpoint")(command)
+    command = click.option("--workers", type=int, default=_env_default("workers"), help="Number of worker processes")(command)
+    command = click.option("--port", type=int, default=_env_default("port"), help="Port to run the server on")(command)
+    return click.option("--host", type=str, default=_env_default("host"), help="Host to bind the server to")(command)
+
+@click.group()
+def app() -> None:
+    """
+    Serve or validate Just-Agents configurations.
 
+    CONFIG is the path or URL (s3://, https://, ...) of the YAML configuration file,
+    it defaults to 'agent_profiles.yaml' in the current directory.
+    """
+
+@app.command("run-server-command")
+@_server_options
+@_config_options
+def run_server_command(
+    config: Optional[str],
+    host: str,
+    port: int,
+    workers: int,
+    title: str,
+    section: Optional[str],
+    parent_section: Optional[str],
+    debug: bool,
 ) -> None:
     """Run the FastAPI server with the given configuration."""
-    with start_task(action_type="run_agent_server"):
+    if debug:
+        from eliot import start_task
+        server_task = start_task(action_type="run_agent_server")
+    else:
+        server_task = nullcontext()  # keep eliot out of the serving process unless debugging
+    with server_task:
         run_agent_server(
             config=config,
             host=host,
@@ -117,48 +261,45 @@ def run_server_command(
             section=section,
             parent_section=parent_section,
             debug=debug,
-            api_class=AgentRestAPI
+            api_class=_default_api_class()
         )
 
-@app.command()
+@app.command("validate-config")
+@_config_options
 def validate_config(
-    config: Optional[Path] = typer.Argument(
-        None,
-        help="Path to the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory"
-    ),
-    section: Optional[str] = typer.Option(env_config.section, help="Optional section name in the config file"),
-    parent_section: Optional[str] = typer.Option(env_config.parent_section, help="Optional parent section name in the config file"),
-    debug: bool = typer.Option(env_config.debug, help="Debug mode"),
-
+    config: Optional[str],
+    section: Optional[str],
+    parent_section: Optional[str],
+    debug: bool,
 ) -> None:
     """Validate the agent configuration without starting the server."""
+    from eliot import start_action
     with start_action(action_type="validate_agent_config.write") as action:
         validate_agent_config(
             config=config,
             section=section,
             parent_section=parent_section,
             debug=debug,
-            api_class=AgentRestAPI
+            api_class=_default_api_class(),
+            reuse=True  # a run-server-command later in this process serves the validated API
         )
         action.log(
             message_type=f"Configuration validation successful!",
             action="validate_config_success"
         )
 
-@app.command()
+@app.command("run-chat-ui-server-command")
+@_server_options
+@_config_options
 def run_chat_ui_server_command(
-    config: Optional[Path] = typer.Argument(
-        None,
-        help="Path to the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory"
-    ),
-    host: str = typer.Option(env_config.host, help="Host to bind the server to"),
-    port: int = typer.Option(env_config.port, help="Port to run the server on"),
-    workers: int = typer.Option(env_config.workers, help="Number of worker processes"),
-    title: str = typer.Option(env_config.title, help="Title for the API endpoint"),
-    section: Optional[str] = typer.Option(env_config.section, help="Optional section name in the config file"),
-    parent_section: Optional[str] = typer.Option(env_config.parent_section, help="Optional parent section name in the config file"),
-    debug: bool = typer.Option(env_config.debug, help="Debug mode"),
-
+    config: Optional[str],
+    host: str,
+    port: int,
+    workers: int,
+    title: str,
+    section: Optional[str],
+    parent_section: Optional[str],
+    debug: bool,
 ) -> None:
     """Run the FastAPI server for ChatUIAgentRestAPI with the given configuration."""
     run_agent_server(
@@ -170,18 +311,16 @@ def run_chat_ui_server_command(
         section=section,
         parent_section=parent_section,
         debug=debug,
-        api_class=ChatUIAgentRestAPI
+        api_class=_chat_ui_api_class()
     )
 
-@app.command()
+@app.command("validate-chat-ui-config")
+@_config_options
 def validate_chat_ui_config(
-    config: Optional[Path] = typer.Argument(
-        None,
-        help="Path to the YAML configuration file. Defaults to 'agent_profiles.yaml' in current directory"
-    ),
-    section: Optional[str] = typer.Option(env_config.section, help="Optional section name in the config file"),
-    parent_section: Optional[str] = typer.Option(env_config.parent_section, help="Optional parent section name in the config file"),
-    debug: bool = typer.Option(env_config.debug, help="Debug mode"),
+    config: Optional[str],
+    section: Optional[str],
+    parent_section: Optional[str],
+    debug: bool,
 ) -> None:
     """Validate the ChatUIAgentRestAPI configuration without starting the server."""
     validate_agent_config(
@@ -189,9 +328,10 @@ def validate_chat_ui_config(
         section=section,
         parent_section=parent_section,
         debug=debug,
-        api_class=ChatUIAgentRestAPI
+        api_class=_chat_ui_api_class(),
+        reuse=True  # a run-chat-ui-server-command later in this process serves the validated API
     )
 
 if __name__ == "__main__":
-    # Run the Typer app which will show help by default
+    # Run the Click group which lists the commands when called without one
     app()
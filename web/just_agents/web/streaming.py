@@ -95,7 +95,7 @@ async def generate_response_chunks(response: ChatCompletionResponse, stop: Optio
             object="chat.completion.chunk",
             id=response.id,
             choices=[delta],
-            created=int(time.time()),
+            created=response.created,  # chunks of one response share its creation time
             model=response.model,
         )
         chunk = chunk.model_dump_json()
@@ -106,7 +106,7 @@ async def generate_response_chunks(response: ChatCompletionResponse, stop: Optio
     final_chunk = ChatCompletionChunkResponse(
         object="chat.completion.chunk",
         id=response.id,
-        created=int(time.time()),
+        created=response.created,
         model=response.model,
         choices=[ChatCompletionChoiceChunk(
             index=0,
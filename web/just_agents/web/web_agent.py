@@ -5,9 +5,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import ClassVar, Optional, Dict, Any, Callable, Literal, Type, Generator, Union
 from just_agents.base_agent import BaseAgent, BaseAgentWithLogging, VariArgs, LogFunction, BaseModelResponse, SupportedMessages
-from just_agents.just_serialization import JustSerializable
+from just_agents.just_serialization import JustSerializable, JustYaml
 from pydantic import Field,BaseModel,PrivateAttr
-import yaml
 from eliot import start_action,start_task, Action
 from just_agents.just_bus import SingletonMeta
 from pycomfort.logging import to_nice_file, to_nice_stdout
@@ -167,39 +166,33 @@ class WebAgent(BaseAgentWithLogging,WebAgentEliotLoggerMixin):
             if required_base_class is None:
                 required_base_class = getattr(cls, 'REQUIRED_CLASS', None) or cls
 
-            with yaml_path.open('r') as f:
-                config_data = yaml.safe_load(f) or {}
+            # Only the section names are read here, each agent constructs just its own section below
+            top_level_keys = JustYaml.yaml_section_keys(yaml_path)
 
             agents : Dict[str,BaseAgent] = {}
 
             # Get the correct section data
-            if parent_section:
-                sections = config_data.get(parent_section, {})
-            else:
-                if "agent_profiles" in config_data:
-                    sections = config_data["agent_profiles"]
+            if not parent_section:
+                if "agent_profiles" in top_level_keys:
                     parent_section = "agent_profiles"
-                elif "agents" in config_data:
-                    sections = config_data["agents"]
+                elif "agents" in top_level_keys:
                     parent_section = "agents"
-                else:
-                    sections = config_data
+            section_names = JustYaml.yaml_section_keys(yaml_path, parent_section) if parent_section else top_level_keys
 
             # Process each section
-            selected_sections = {}
+            selected_sections = section_names
             if section:
-                if section in sections:
-                    sections = {section: sections[section]}
+                if section in section_names:
+                    selected_sections = [section]
                 else:
+                    selected_sections = []
                     action.log(
                         message_type="agent.config_error",
                         error=f"Section {section} not found in {parent_section} of {yaml_path}",
                         action="agent_config_error"
                     )
-            else:
-                selected_sections = sections
 
-            for section_name, section_data in selected_sections.items():
+            for section_name in selected_sections:
                 try:
                     auto_instance : JustSerializable = WebAgent.from_yaml_auto(
                         section_name,